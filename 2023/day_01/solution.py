@@ -1,86 +1,365 @@
 import os
-import argparse
 import re
-from helper import (
-    extract_example_data_and_answers,
-    run_example,
-    run_real_data,
-    profile,
-    infer_type,
-)
+import helper as helper
 
+DIGIT = re.compile("[0-9]")
 
-def read_data(data):
-    return [(line.strip()) for line in data.splitlines()]
 
+@helper.profile
+def solution_p1(data, debug_mode=False):
+    """
+    Sums the calibration values: the first and last digit of every line as a two-digit number.
 
-@profile
-def solution_part_a(data):
+    Args:
+    data (iterable): Lines of the calibration document, a list or a line stream.
+    debug_mode (bool): Flag to enable debugging mode.
+
+    Returns:
+    int: The sum of the calibration values.
+    """
     total_sum = 0
 
+    find_digit = DIGIT.search
     for line in data:
-        first_digit = next((char for char in line if char.isdigit()), None)
-        last_digit = next((char for char in reversed(line) if char.isdigit()), None)
-
-        if first_digit is not None and last_digit is not None:
-            two_digit_number = int(first_digit + last_digit)
-            total_sum += two_digit_number
+        first_digit = find_digit(line)
+        if first_digit is None:
+            continue
+        last_digit = find_digit(line[::-1])
+        total_sum += int(first_digit[0]) * 10 + int(last_digit[0])
 
     return total_sum
 
 
-def word_to_num(word) -> int:
-    if word == "one":
-        return 1
-    elif word == "two":
-        return 2
-    elif word == "three":
-        return 3
-    elif word == "four":
-        return 4
-    elif word == "five":
-        return 5
-    elif word == "six":
-        return 6
-    elif word == "seven":
-        return 7
-    elif word == "eight":
-        return 8
-    elif word == "nine":
-        return 9
-    else:
-        return int(word)
+@helper.profile
+@helper.preload("numpy")
+def solution_p1_bulk(buffer):
+    """
+    Part 1 over the raw input bytes: finds the first and last ASCII digit of every line
+    with NumPy, using the newline offsets, instead of scanning characters in Python.
+
+    Args:
+    buffer (memoryview): The whole input file.
+
+    Returns:
+    int: The sum of the calibration values.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return solution_p1.__wrapped__(bytes(buffer).decode().splitlines())
+
+    chars = np.frombuffer(buffer, dtype=np.uint8)
+    newlines = np.flatnonzero(chars == ord("\n"))
+    line_starts = np.concatenate(([0], newlines + 1))
+    line_ends = np.concatenate((newlines, [len(chars)]))
+    digits = np.flatnonzero((chars >= ord("0")) & (chars <= ord("9")))
+    if len(digits) == 0:
+        return 0
+
+    # first digit at or after each line start, last digit before each line end
+    first = np.searchsorted(digits, line_starts)
+    last = np.searchsorted(digits, line_ends) - 1
+    # lines without digits have their 'first' digit past their 'last' one
+    has_digit = first <= last
+    first_values = chars[digits[first[has_digit]]].astype(np.int64) - ord("0")
+    last_values = chars[digits[last[has_digit]]].astype(np.int64) - ord("0")
+
+    return int(first_values.sum() * 10 + last_values.sum())
+
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+# value of every match, spelled out or numeric, and of its reversed spelling
+DIGIT_VALUES = {word: value for value, word in enumerate(DIGIT_WORDS, start=1)}
+DIGIT_VALUES.update({str(digit): digit for digit in range(10)})
+REVERSED_DIGIT_VALUES = {token[::-1]: value for token, value in DIGIT_VALUES.items()}
+
+
+def trie_pattern(words) -> str:
+    """
+    Builds a regex alternation shaped like a trie of the words, so shared prefixes
+    are only matched once (e.g. 't(?:hree|wo)' instead of 'two|three').
+
+    Args:
+    words (list): Words to match.
+
+    Returns:
+    str: The regex pattern.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end of a word
+
+    def emit(node):
+        alternatives = [
+            re.escape(char) + emit(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not alternatives:
+            return ""
+        if "" in node:
+            return f"(?:{'|'.join(alternatives)})?"
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return f"(?:{'|'.join(alternatives)})"
+
+    return emit(trie)
 
 
-@profile
-def solution_part_b(data):
+# compiled once: the first match scanning forward, and the last match found by
+# scanning the reversed line for the reversed words
+FIRST_DIGIT = re.compile("[0-9]|" + trie_pattern(DIGIT_WORDS))
+LAST_DIGIT = re.compile("[0-9]|" + trie_pattern(word[::-1] for word in DIGIT_WORDS))
+
+
+@helper.profile
+def solution_p2(data, debug_mode=False):
+    """
+    Sums the calibration values with spelled-out digits ('one' to 'nine') counting as digits.
+
+    Args:
+    data (iterable): Lines of the calibration document, a list or a line stream.
+    debug_mode (bool): Flag to enable debugging mode.
+
+    Returns:
+    int: The sum of the calibration values.
+    """
     total_sum = 0
 
+    find_first = FIRST_DIGIT.search
+    find_last = LAST_DIGIT.search
     for line in data:
-        matches = re.findall(
-            "(?=(one|two|three|four|five|six|seven|eight|nine|[0-9]))", line
+        first_digit = find_first(line)
+        if first_digit is None:
+            continue
+        last_digit = find_last(line[::-1])
+        total_sum += (
+            DIGIT_VALUES[first_digit[0]] * 10 + REVERSED_DIGIT_VALUES[last_digit[0]]
         )
-        first_digit_str = word_to_num(matches[0])
-        last_digit_str = word_to_num(matches[-1])
-        total_sum += int(f"{first_digit_str}{last_digit_str}")
 
     return total_sum
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Run Advent of Code solution.")
-    parser.add_argument("--example", action="store_true", help="Use example data")
-    args = parser.parse_args()
+@helper.profile
+def solution_both(data):
+    """
+    Sums both parts in a single pass, so a line stream is read only once.
 
-    if args.example:
-        try:
-            example_data_and_answers = extract_example_data_and_answers()
-            run_example(
-                example_data_and_answers, read_data, solution_part_a, solution_part_b
+    Args:
+    data (iterable): Lines of the calibration document, a list or a line stream.
+
+    Returns:
+    tuple: The results of part 1 and part 2.
+    """
+    sum_p1 = sum_p2 = 0
+
+    find_digit = DIGIT.search
+    find_first = FIRST_DIGIT.search
+    find_last = LAST_DIGIT.search
+    for line in data:
+        reversed_line = line[::-1]
+        first_digit = find_digit(line)
+        if first_digit is not None:
+            last_digit = find_digit(reversed_line)
+            sum_p1 += int(first_digit[0]) * 10 + int(last_digit[0])
+
+        # like part 1, lines without any digit (e.g. blank lines) add nothing
+        first_digit = find_first(line)
+        if first_digit is not None:
+            last_digit = find_last(reversed_line)
+            sum_p2 += (
+                DIGIT_VALUES[first_digit[0]] * 10 + REVERSED_DIGIT_VALUES[last_digit[0]]
             )
-        except Exception as e:
-            print(f"Error processing example.txt:\n\n {e}\n")
-            print("This format of example.txt is not currently supported.")
 
+    return sum_p1, sum_p2
+
+
+def chunk_ranges(file_path, chunks):
+    """
+    Splits a file into byte ranges that start and end on line boundaries.
+
+    Args:
+    file_path (str): Path to the input file.
+    chunks (int): Number of ranges to aim for.
+
+    Returns:
+    list: (start, end) byte offsets covering the whole file.
+    """
+    size = os.path.getsize(file_path)
+    boundaries = [0]
+    with open(file_path, "rb") as file:
+        for i in range(1, chunks):
+            # move the cut to just after the next newline
+            file.seek(max(size * i // chunks, boundaries[-1]))
+            file.readline()
+            boundaries.append(min(file.tell(), size))
+    boundaries.append(size)
+    return [
+        (start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end
+    ]
+
+
+def solve_chunk(file_path, start, end):
+    """
+    Solves both parts over the lines of one byte range.
+
+    Args:
+    file_path (str): Path to the input file.
+    start (int): Offset of the first byte of the range.
+    end (int): Offset just past the last byte of the range.
+
+    Returns:
+    tuple: The partial sums of part 1 and part 2.
+    """
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        lines = file.read(end - start).decode().splitlines()
+    return solution_both.__wrapped__(line.strip() for line in lines)
+
+
+@helper.profile
+def solution_parallel(file_path, workers):
+    """
+    Sums both parts over the input in parallel: every worker process reads and solves
+    its own newline-aligned byte range and returns partial sums.
+
+    Args:
+    file_path (str): Path to the input file.
+    workers (int): Number of worker processes.
+
+    Returns:
+    tuple: The results of part 1 and part 2.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    # a few ranges per worker, so one slow range does not leave the others idle
+    ranges = chunk_ranges(file_path, workers * 4)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partial_sums = list(
+            executor.map(
+                solve_chunk,
+                [file_path] * len(ranges),
+                *zip(*ranges),
+            )
+        )
+    return tuple(sum(part_sums) for part_sums in zip(*partial_sums)) or (0, 0)
+
+
+def add_arguments(parser):
+    """
+    Adds the day's own solving modes to the harness arguments.
+
+    Args:
+    parser (argparse.ArgumentParser): The harness argument parser.
+    """
+    # the parts iterate over lines, which a list and a line stream both provide
+    helper.add_input_mode_argument(parser, ("lines", "stream"))
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument(
+        "--one-pass",
+        action="store_true",
+        help="Solve both parts in a single pass over the streamed input",
+    )
+    modes.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Solve part 1 over the memory-mapped input bytes with NumPy",
+    )
+    modes.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="Solve both parts with N processes, each over a chunk of the input",
+    )
+
+
+def check_arguments(parser, args):
+    """
+    Rejects the harness options the day's own solving modes don't support.
+
+    These modes solve both parts once on the real input, so part selection, examples,
+    benchmarking, profiling, the resource limits and the other run modes would be ignored.
+
+    Args:
+    parser (argparse.ArgumentParser): The harness argument parser.
+    args (argparse.Namespace): Parsed command line arguments.
+    """
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers needs at least 1 process")
+    if args.one_pass:
+        mode = "--one-pass"
+    elif args.bulk:
+        mode = "--bulk"
+    elif args.workers is not None:
+        mode = "--workers"
     else:
-        run_real_data(read_data, solution_part_a, solution_part_b)
+        return
+
+    unsupported = [
+        option
+        for option, value in (
+            ("--example", args.example),
+            ("--p1", args.p1),
+            ("--p2", args.p2),
+            ("--bench", args.bench),
+            ("--mem", args.mem),
+            ("--profile-out", args.profile_out),
+            ("--compare", args.compare),
+            ("--timeout", args.timeout),
+            ("--max-memory", args.max_memory),
+            ("--watch", args.watch),
+            ("--parallel", args.parallel),
+            ("--input-mode", args.input_mode),
+        )
+        if value
+    ]
+    if unsupported:
+        parser.error(f"{mode} can't be combined with {', '.join(unsupported)}")
+
+
+def run_day_mode(args):
+    """
+    Runs one of the day's own solving modes on the real input and prints both parts.
+
+    Args:
+    args (argparse.Namespace): Parsed command line arguments.
+    """
+    helper.verify_input_file(is_example=False)
+    helper.print_running_mode(args)
+
+    if args.bulk:
+        result_p1, time_p1 = solution_p1_bulk(helper.read_input_buffer(args.input))
+        result_p2, time_p2 = solution_p2(helper.read_input_stream(args.input))
+    else:
+        if args.workers:
+            results, exec_time = solution_parallel(args.input, args.workers)
+        else:
+            results, exec_time = solution_both(helper.read_input_stream(args.input))
+        # both parts come out of the same run, which is timed once
+        (result_p1, result_p2), time_p1, time_p2 = results, exec_time, exec_time
+
+    for part, result, exec_time in ((1, result_p1, time_p1), (2, result_p2, time_p2)):
+        if helper.output_format != "text":
+            helper.emit_result_record(
+                "day_01", "input", part, result, exec_time=exec_time
+            )
+        else:
+            helper.print_solution_result(result, exec_time, part)
+
+
+if __name__ == "__main__":
+    args = helper.parse_arguments(add_arguments, check_arguments)
+    if args.example:
+        helper.run_example_solutions(
+            solution_p1, solution_p2, args, input_mode="stream"
+        )
+    elif args.one_pass or args.bulk or args.workers:
+        run_day_mode(args)
+    else:
+        helper.run_solutions(
+            args.input, solution_p1, solution_p2, args, input_mode="stream"
+        )
@@ -1,124 +1,138 @@
+from array import array
+from typing import Any, NamedTuple
+
 import helper as helper
 
+# available cubes for each color
+AVAILABLE_CUBES = {"red": 12, "green": 13, "blue": 14}
+
 
-def parse_game_data(game_data):
+class GameTable(NamedTuple):
     """
-    parse the game data and return a list of dict w/ each
-    having the count of cubes for each color in that subset
+    Every game reduced to the highest count drawn of each color, one column per field.
+
+    The columns are NumPy arrays when NumPy is installed, otherwise arrays of the array module.
     """
-    game_parts = game_data.split("; ")
-    cube_counts = []
-    for part in game_parts:
-        counts = {}
-        cubes = part.split(", ")
-        for cube in cubes:
-            number, color = cube.split(" ")
-            counts[color] = int(number)
-        cube_counts.append(counts)
-    return cube_counts
 
+    game_id: Any
+    max_red: Any
+    max_green: Any
+    max_blue: Any
 
-@helper.profile
-def solution_p1(data, debug_mode=False):
-    if helper.debug_solution_mode:
-        print("Debugging is enabled in solution_p1")
 
-    # available cubes for each color
-    available_cubes = {"red": 12, "green": 13, "blue": 14}
-    possible_games = []
+def load_numpy():
+    """
+    Returns NumPy, which is optional for this day; parse has it preloaded by the harness.
 
-    for line in data:
-        # get game_id and game_data from each line
-        game_id, game_data = line.split(": ")
-        game_id = int(game_id.split(" ")[1])
-        cube_counts = parse_game_data(game_data)
-
-        if helper.debug_solution_mode:
-            print(f"Processing Game {helper.green_text(str(game_id))}:")
-            for subset in cube_counts:
-                print(f"  Subset: {helper.green_text(str(subset))}")
-
-        possible = True
-        for subset in cube_counts:
-            for (
-                color,
-                count,
-            ) in subset.items():  # iterate over each color and count in the subset
-                if (
-                    count > available_cubes[color]
-                ):  # if count is greater than available cubes for that color
-                    possible = False  # nope
-                    if helper.debug_solution_mode:
-                        print(
-                            f"    Game {helper.green_text(str(game_id))} is not possible due to {helper.red_text(str(count))} {color} cubes"
-                        )
-                    break
-            if not possible:
-                break
-
-        # yep
-        if possible:
-            if helper.debug_solution_mode:
-                print(f"    Game {helper.green_text(str(game_id))} is possible")
-            possible_games.append(game_id)
-
-    sum_of_ids = sum(possible_games)
-    if helper.debug_solution_mode:
-        print(f"Sum of IDs of possible games: {helper.green_text(str(sum_of_ids))}")
+    Returns:
+    module: The numpy module, or None if it isn't installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@helper.preload("numpy")
+def parse(data):
+    """
+    Reduces each game to its id and the highest count of every color over all draws.
+
+    Args:
+    data (list): Lines of the puzzle input, 'Game N: 3 blue, 4 red; 1 red, 2 green'.
+
+    Returns:
+    GameTable: The columns of the reduced games.
+    """
+    columns = [array("q") for _ in range(4)]
+    game_ids, max_red, max_green, max_blue = columns
 
-    return sum_of_ids
+    for line in data:
+        if not line:
+            continue
+        game, draws = line.split(": ")
+        highest = {"red": 0, "green": 0, "blue": 0}
+        # the draw boundaries don't matter for the maximum, only every 'N color' count
+        for cube in draws.replace(";", ",").split(", "):
+            count, color = cube.split(" ")
+            count = int(count)
+            if count > highest[color]:
+                highest[color] = count
+
+        game_ids.append(int(game[5:]))
+        max_red.append(highest["red"])
+        max_green.append(highest["green"])
+        max_blue.append(highest["blue"])
+
+    np = load_numpy()
+    if np is not None:
+        # wrap the array buffers without copying them
+        columns = [np.frombuffer(column, dtype=np.int64) for column in columns]
+    return GameTable(*columns)
 
 
 @helper.profile
-def solution_p2(data, debug_mode=False):
+def solution_p1(games, debug_mode=False):
+    """
+    Sums the ids of the games that are possible with the available cubes.
+
+    Args:
+    games (GameTable): The parsed games.
+    debug_mode (bool): Flag to enable debugging mode.
+
+    Returns:
+    int: The sum of the ids of the possible games.
+    """
     if helper.debug_solution_mode:
-        print("Debugging is enabled in solution_p2")
+        print("Debugging is enabled in solution_p1")
+        for game in zip(*(column.tolist() for column in games)):
+            print(f"Game {helper.green_text(str(game[0]))}: max (r, g, b) {game[1:]}")
+
+    if load_numpy() is None:
+        return sum(
+            game_id
+            for game_id, red, green, blue in zip(*games)
+            if red <= AVAILABLE_CUBES["red"]
+            and green <= AVAILABLE_CUBES["green"]
+            and blue <= AVAILABLE_CUBES["blue"]
+        )
 
-    # find the power of a set of cubes
-    def calculate_power(cubes):
-        return cubes["red"] * cubes["green"] * cubes["blue"]
+    possible = (
+        (games.max_red <= AVAILABLE_CUBES["red"])
+        & (games.max_green <= AVAILABLE_CUBES["green"])
+        & (games.max_blue <= AVAILABLE_CUBES["blue"])
+    )
+    return int(games.game_id[possible].sum())
 
-    total_power = 0
-    for line in data:
-        game_id, game_data = line.split(": ")
-        game_id = int(game_id.split(" ")[1])
-        cube_counts = parse_game_data(game_data)
-
-        if helper.debug_solution_mode:
-            print(f"Processing Game {helper.green_text(str(game_id))}:")
-            for subset in cube_counts:
-                print(f"  Subset: {helper.green_text(str(subset))}")
-
-        # Determine the minimum set of cubes for the game
-        min_cubes = {"red": 0, "green": 0, "blue": 0}
-        for subset in cube_counts:
-            for color, count in subset.items():
-                min_cubes[color] = max(
-                    min_cubes[color], count
-                )  # highest count of each color in all subsets
-
-        power = calculate_power(min_cubes)
-        total_power += power
-
-        if helper.debug_solution_mode:
-            print(
-                f"  Minimum cubes for Game {helper.green_text(str(game_id))}: {helper.green_text(str(min_cubes))}"
-            )
-            print(
-                f"  Power of Game {helper.green_text(str(game_id))}: {helper.green_text(str(power))}"
-            )
 
+@helper.profile
+def solution_p2(games, debug_mode=False):
+    """
+    Sums the power (red * green * blue) of the smallest set of cubes each game needs.
+
+    Args:
+    games (GameTable): The parsed games.
+    debug_mode (bool): Flag to enable debugging mode.
+
+    Returns:
+    int: The sum of the powers of all games.
+    """
     if helper.debug_solution_mode:
-        print(
-            f"Sum of the power of minimum sets: {helper.green_text(str(total_power))}"
+        print("Debugging is enabled in solution_p2")
+
+    if load_numpy() is None:
+        return sum(
+            red * green * blue
+            for red, green, blue in zip(games.max_red, games.max_green, games.max_blue)
         )
 
-    return total_power
+    return int((games.max_red * games.max_green * games.max_blue).sum())
 
 
 if __name__ == "__main__":
     args = helper.parse_arguments()
     if args.example:
-        helper.run_examples(solution_p1, solution_p2)
+        helper.run_example_solutions(solution_p1, solution_p2, args, parse=parse)
     else:
-        helper.run_solutions(args.input, solution_p1, solution_p2, args)
+        helper.run_solutions(args.input, solution_p1, solution_p2, args, parse=parse)
@@ -70,6 +70,6 @@ def solution_p2(data, debug_mode=False):
 if __name__ == "__main__":
     args = helper.parse_arguments()
     if args.example:
-        helper.run_examples(solution_p1, solution_p2)
+        helper.run_example_solutions(solution_p1, solution_p2, args)
     else:
         helper.run_solutions(args.input, solution_p1, solution_p2, args)
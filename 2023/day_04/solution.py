@@ -1,18 +1,16 @@
 import helper as helper
 
 
-@helper.profile
-def solution_p1(data, debug_mode: bool = False):
+def parse(data):
     """
-    Calculate the total points from the scratchcard data.
+    Parse the scratchcards once for both parts.
 
     Args:
     data (list): Input data for the puzzle, each element is a line.
-    debug_mode (bool): Flag to enable debugging mode.
-    """
-    if helper.debug_solution_mode:
-        print(helper.green_text("Debugging is enabled in solution_p1"))
 
+    Returns:
+    dict: Card number mapped to a tuple of (winning numbers, player's numbers) sets.
+    """
     cards = {}
 
     for line in data:
@@ -21,7 +19,7 @@ def solution_p1(data, debug_mode: bool = False):
 
         card_index, numbers = line.split(":")
         winning, player = numbers.split("|")
-        cards[card_index.strip()] = (
+        cards[int(card_index.split()[1])] = (
             set(map(int, winning.split())),
             set(map(int, player.split())),
         )
@@ -31,6 +29,21 @@ def solution_p1(data, debug_mode: bool = False):
                 f"Processing {card_index.strip()}: Winning numbers [{winning}], Player's numbers [{player}]"
             )
 
+    return cards
+
+
+@helper.profile
+def solution_p1(cards, debug_mode: bool = False):
+    """
+    Calculate the total points from the scratchcard data.
+
+    Args:
+    cards (dict): Parsed scratchcards as returned by parse.
+    debug_mode (bool): Flag to enable debugging mode.
+    """
+    if helper.debug_solution_mode:
+        print(helper.green_text("Debugging is enabled in solution_p1"))
+
     total_points = 0
 
     for card_index, card in cards.items():
@@ -59,29 +72,17 @@ def solution_p1(data, debug_mode: bool = False):
 
 
 @helper.profile
-def solution_p2(data, debug_mode: bool = False):
+def solution_p2(cards, debug_mode: bool = False):
     """
     Calculate the total number of scratchcards including the copies won.
 
     Args:
-    data (list): Input data for the puzzle.
+    cards (dict): Parsed scratchcards as returned by parse.
     debug_mode (bool): Flag to enable debugging mode.
     """
     if helper.debug_solution_mode:
         print(helper.green_text("Debugging is enabled in solution_p2"))
 
-    cards = {}
-    for line in data:
-        if line.strip() == "":
-            continue
-
-        card_index, numbers = line.split(":")
-        winning, player = numbers.split("|")
-        cards[int(card_index.split()[1])] = (
-            set(map(int, winning.split())),
-            set(map(int, player.split())),
-        )
-
     total_cards = 0
     card_counts = {i: 1 for i in cards}
 
@@ -121,6 +122,6 @@ def solution_p2(data, debug_mode: bool = False):
 if __name__ == "__main__":
     args = helper.parse_arguments()
     if args.example:
-        helper.run_example_solutions(solution_p1, solution_p2, args)
+        helper.run_example_solutions(solution_p1, solution_p2, args, parse=parse)
     else:
-        helper.run_solutions(args.input, solution_p1, solution_p2, args)
+        helper.run_solutions(args.input, solution_p1, solution_p2, args, parse=parse)
@@ -20,6 +20,12 @@ def parse_mappings(data):
     return mappings
 
 
+def parse(data):
+    # parse the seeds and every mapping category once for both parts
+    seeds = list(map(int, data[0].split(":")[1].strip().split()))
+    return seeds, parse_mappings(data)
+
+
 def map_number(source, ranges):
     # map a number from source through the give ranges
     # finds appropriate mapping range that includes the source number
@@ -31,14 +37,11 @@ def map_number(source, ranges):
 
 
 @helper.profile
-def solution_p1(data, debug_mode: bool = False):
+def solution_p1(parsed, debug_mode: bool = False):
     if helper.debug_solution_mode:
         print(helper.green_text("Debugging is enabled in solution_p1"))
 
-    mappings = parse_mappings(data)
-
-    seeds_line = data[0]
-    seeds = list(map(int, seeds_line.split(":")[1].strip().split()))
+    seeds, mappings = parsed
     lowest_location = float("inf")
 
     for seed in seeds:
@@ -65,10 +68,9 @@ def solution_p1(data, debug_mode: bool = False):
     return lowest_location
 
 
-def parse_seed_ranges(line):
-    # split the line to extract the seed ranges and convert them to integer tuples
-    parts = line.split(":")[1].strip().split()
-    return [(int(parts[i]), int(parts[i + 1])) for i in range(0, len(parts), 2)]
+def parse_seed_ranges(seeds):
+    # pair up the seed values into ranges
+    return [(seeds[i], seeds[i + 1]) for i in range(0, len(seeds), 2)]
     # each tuple is a range with a start and a length
 
 
@@ -118,12 +120,12 @@ def apply_map_to_range(source_range, map_entry):
 
 
 @helper.profile
-def solution_p2(data, debug_mode: bool = False):
+def solution_p2(parsed, debug_mode: bool = False):
     if helper.debug_solution_mode:
         print(helper.green_text("Debugging is enabled in solution_p2"))
 
-    mappings = parse_mappings(data)
-    seed_ranges = parse_seed_ranges(data[0])
+    seeds, mappings = parsed
+    seed_ranges = parse_seed_ranges(seeds)
     lowest_location = float("inf")
 
     for map_category in [
@@ -202,6 +204,6 @@ def solution_p2(data, debug_mode: bool = False):
 if __name__ == "__main__":
     args = helper.parse_arguments()
     if args.example:
-        helper.run_example_solutions(solution_p1, solution_p2, args)
+        helper.run_example_solutions(solution_p1, solution_p2, args, parse=parse)
     else:
-        helper.run_solutions(args.input, solution_p1, solution_p2, args)
+        helper.run_solutions(args.input, solution_p1, solution_p2, args, parse=parse)
@@ -2,6 +2,7 @@ import helper as helper
 import functools
 
 
+@helper.strip_debug
 def rank_hand(hand):
     values = "AKQJT98765432"
     value_to_rank = {v: i for i, v in enumerate(values)}
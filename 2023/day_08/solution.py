@@ -18,10 +18,14 @@ def parse_instructions(data):
     return data[0]
 
 
+def parse(data):
+    # parse the instructions and the network once for both parts
+    return parse_instructions(data), parse_network(data)
+
+
 @helper.profile
-def solution_p1(data, debug_mode: bool = False):
-    network = parse_network(data)
-    instructions = parse_instructions(data)
+def solution_p1(parsed, debug_mode: bool = False):
+    instructions, network = parsed
     current_node = "AAA"
     steps = 0
 
@@ -52,9 +56,8 @@ def lcm(a, b):
 
 
 @helper.profile
-def solution_p2(data, debug_mode: bool = False):
-    network = parse_network(data)
-    instructions = parse_instructions(data)
+def solution_p2(parsed, debug_mode: bool = False):
+    instructions, network = parsed
     a_nodes = {node for node in network if node.endswith("A")}
 
     # precompute destinations
@@ -85,6 +88,6 @@ def solution_p2(data, debug_mode: bool = False):
 if __name__ == "__main__":
     args = helper.parse_arguments()
     if args.example:
-        helper.run_example_solutions(solution_p1, solution_p2, args)
+        helper.run_example_solutions(solution_p1, solution_p2, args, parse=parse)
     else:
-        helper.run_solutions(args.input, solution_p1, solution_p2, args)
+        helper.run_solutions(args.input, solution_p1, solution_p2, args, parse=parse)
@@ -6,6 +6,7 @@ def generate_difference_sequence(values):
     return [values[i + 1] - values[i] for i in range(len(values) - 1)]
 
 
+@helper.strip_debug
 def extrapolate_next_value(sequence):
     sequences = [sequence]
 
@@ -63,6 +64,7 @@ def solution_p1(data, debug_mode: bool = False):
     return total_sum
 
 
+@helper.strip_debug
 def extrapolate_previous_value(sequence):
     sequences = [sequence]
 
@@ -19,7 +19,8 @@ def is_valid_pipe_connection(x, y, nx, ny, grid):
     return False
 
 
-def get_neighbors(x, y, grid, debug_mode):
+@helper.strip_debug
+def get_neighbors(x, y, grid):
     pipe = grid[x][y]
     directions = {
         "|": [(1, 0), (-1, 0)],  # vertical
@@ -41,7 +42,7 @@ def get_neighbors(x, y, grid, debug_mode):
                 if is_valid_pipe_connection(x, y, nx, ny, grid):
                     neighbors.append((nx, ny))
 
-    if debug_mode:
+    if helper.debug_solution_mode:
         print(f"Pipe at ({x}, {y}) [{pipe}]: neighbors -> {neighbors}")
     return neighbors
 
@@ -82,7 +83,7 @@ def solution_p1(data, debug_mode: bool = False):
 
         visited.add((x, y))
         distance_grid[x][y] = str(dist)  # Mark the distance
-        neighbors = get_neighbors(x, y, grid, helper.debug_solution_mode)
+        neighbors = get_neighbors(x, y, grid)
 
         if helper.debug_solution_mode:
             print(f"At position ({x}, {y}), distance: {dist}, neighbors: {neighbors}")
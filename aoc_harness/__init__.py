@@ -0,0 +1,6 @@
+"""
+Shared harness for the Advent of Code solutions.
+
+Every day imports the same ``aoc_harness.helper`` module (through its local ``helper.py``
+shim), so timing, caching and parallel execution are implemented once for all days.
+"""
@@ -0,0 +1,281 @@
+import os
+import sys
+import glob
+import argparse
+from typing import Any, Dict, List, Optional, Tuple
+
+from aoc_harness import helper
+from aoc_harness.generators import available_days, generate_input
+from aoc_harness.runner import day_number, discover_days, load_solution
+
+REFERENCE_VARIANT = "solution.py"
+
+
+def discover_variants(day_dir: str) -> List[str]:
+    """
+    Finds every implementation of a day: solution.py and any other solution*.py file.
+
+    Args:
+    day_dir (str): Path to the day directory.
+
+    Returns:
+    List[str]: File names, solution.py first and the others sorted by name.
+    """
+    names = sorted(
+        os.path.basename(path)
+        for path in glob.glob(os.path.join(day_dir, "solution*.py"))
+    )
+    return sorted(names, key=lambda name: name != REFERENCE_VARIANT)
+
+
+def collect_inputs(day_dir: str, args: argparse.Namespace) -> List[Tuple[str, str]]:
+    """
+    Gathers the inputs every variant is run on: input.txt, each example section and,
+    when requested, a generated input.
+
+    Args:
+    day_dir (str): Path to the day directory.
+    args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+    List[Tuple[str, str]]: (label, input text) pairs.
+    """
+    inputs = []
+    input_file = os.path.join(day_dir, "input.txt")
+    if os.path.exists(input_file):
+        with open(input_file, "r") as file:
+            inputs.append(("input", file.read()))
+
+    example_file = os.path.join(day_dir, "example.txt")
+    if os.path.exists(example_file):
+        for i, example in enumerate(helper.parse_example_data(example_file), start=1):
+            inputs.append((f"example {i}", example.data))
+
+    day = day_number(os.path.basename(day_dir))
+    if args.generated and day in available_days():
+        inputs.append(
+            (
+                f"generated {args.generated}",
+                generate_input(day, args.generated, args.seed),
+            )
+        )
+    return inputs
+
+
+def run_variant(
+    module: Any, text: str, parts: List[int], repeats: int
+) -> Dict[int, Tuple[Any, Optional[float], Optional[float]]]:
+    """
+    Runs one implementation on an input, using its own parse hook.
+
+    The parse hook is timed too: variants that parse up front and variants that parse inside
+    their parts are only comparable on parse plus solve time.
+
+    Args:
+    module (Any): The loaded solution module.
+    text (str): The input text.
+    parts (List[int]): Part numbers to run.
+    repeats (int): Timed runs of the parse hook and of each part, the fastest is kept.
+
+    Returns:
+    Dict[int, Tuple[Any, Optional[float], Optional[float]]]: (result, fastest execution time,
+    fastest parse time) by part; the parse time is None without a parse hook, and failing parts
+    report 'error: <ExceptionType>' and no times.
+    """
+    outcomes = {}
+    lines = helper.read_input(text, is_file=False)
+    data, parse_time = lines, None
+    parse = getattr(module, "parse", None)
+    if parse is not None:
+        try:
+            data, parse_time = helper.time_parse(parse, lines, repeats)
+        except Exception as e:
+            return {part: (f"error: {type(e).__name__}", None, None) for part in parts}
+
+    for part in parts:
+        solution_func = getattr(module, f"solution_p{part}")
+        result, best_time = None, None
+        try:
+            for _ in range(repeats):
+                result, exec_time = solution_func(data)
+                best_time = (
+                    exec_time if best_time is None else min(best_time, exec_time)
+                )
+        except Exception as e:
+            result, best_time = f"error: {type(e).__name__}", None
+        outcomes[part] = (result, best_time, parse_time)
+    return outcomes
+
+
+def check_day(day_dir: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Runs every implementation of a day on the same inputs.
+
+    Args:
+    day_dir (str): Path to the day directory.
+    args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+    Dict[str, Any]: The day name, an optional status message, the variant names and per
+    (input label, part) the outcome of every variant.
+    """
+    report = {
+        "day": os.path.basename(day_dir),
+        "status": None,
+        "variants": discover_variants(day_dir),
+        "rows": [],
+    }
+    if len(report["variants"]) < 2:
+        report["status"] = "single implementation"
+        return report
+
+    modules = {}
+    for variant in report["variants"]:
+        try:
+            module = load_solution(day_dir, variant)
+        except Exception as e:
+            report["status"] = f"{variant}: import failed ({type(e).__name__}: {e})"
+            return report
+        if not all(hasattr(module, name) for name in ("solution_p1", "solution_p2")):
+            report["status"] = f"{variant}: no solution_p1/solution_p2"
+            return report
+        modules[variant] = module
+
+    for label, text in collect_inputs(day_dir, args):
+        outcomes = {
+            variant: run_variant(module, text, args.parts, args.repeats)
+            for variant, module in modules.items()
+        }
+        for part in args.parts:
+            report["rows"].append(
+                (
+                    label,
+                    part,
+                    {variant: outcomes[variant][part] for variant in outcomes},
+                )
+            )
+    return report
+
+
+def total_time(
+    outcome: Tuple[Any, Optional[float], Optional[float]],
+) -> Optional[float]:
+    """
+    Adds up the parse and solve time of a part outcome.
+
+    Args:
+    outcome (Tuple[Any, Optional[float], Optional[float]]): A part outcome of run_variant.
+
+    Returns:
+    Optional[float]: The total time, or None if the part failed.
+    """
+    _, exec_time, parse_time = outcome
+    if exec_time is None:
+        return None
+    return exec_time + (parse_time or 0.0)
+
+
+def print_equivalence_report(reports: List[Dict[str, Any]]) -> bool:
+    """
+    Prints whether the implementations of every day agree, with their times side by side.
+
+    Times are parse plus solve time, with the parse share in brackets for variants with a
+    parse hook. Speedups compare those totals and are relative to solution.py.
+
+    Args:
+    reports (List[Dict[str, Any]]): Day reports as returned by check_day.
+
+    Returns:
+    bool: True if every day's implementations gave identical answers.
+    """
+    agreed = True
+
+    for report in reports:
+        helper.print_separator()
+        print(f"{report['day']}: {', '.join(report['variants'])}")
+        if report["status"]:
+            print(helper.yellow_text(report["status"]))
+            continue
+
+        for label, part, outcomes in report["rows"]:
+            results = {str(result) for result, _, _ in outcomes.values()}
+            same = len(results) == 1
+            agreed &= same
+            status = helper.green_text("OK") if same else helper.red_text("MISMATCH")
+            print(f"{label:<16} Part {part}: {status}")
+
+            reference_time = total_time(outcomes[report["variants"][0]])
+            for variant, outcome in outcomes.items():
+                result, _, parse_time = outcome
+                exec_time = total_time(outcome)
+                timing = f"{exec_time:.6f}s" if exec_time is not None else "-"
+                if exec_time is not None and parse_time is not None:
+                    timing += f" (parse {parse_time:.6f}s)"
+                if exec_time and reference_time and variant != report["variants"][0]:
+                    timing += f" {reference_time / exec_time:.2f}x"
+                result_text = f"'{result}'" if not same else ""
+                print(f"    {variant:<24} {timing} {result_text}".rstrip())
+
+    helper.print_separator()
+    if agreed:
+        print(helper.green_text("All implementations agree."))
+    else:
+        print(helper.red_text("Implementations disagree."))
+    helper.print_separator()
+    return agreed
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses and returns command line arguments for the equivalence check.
+
+    Returns:
+    argparse.Namespace: Parsed command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Check that every solution*.py of a day gives the same answers, and compare their speed."
+    )
+    parser.add_argument("--year", default="2023", help="Year directory to check")
+    parser.add_argument(
+        "--day",
+        type=int,
+        nargs="+",
+        metavar="N",
+        help="Only check the given day numbers",
+    )
+    parser.add_argument(
+        "--parts",
+        type=int,
+        nargs="+",
+        choices=(1, 2),
+        default=[1, 2],
+        help="Parts to check (default: both)",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Timed runs per part, the fastest is kept (default: 3)",
+    )
+    parser.add_argument(
+        "--generated",
+        type=int,
+        metavar="SIZE",
+        help="Also compare on an input of this size from the day's generator",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_arguments()
+    reports = [
+        check_day(day_dir, args) for day_dir in discover_days(args.year, args.day)
+    ]
+    if not print_equivalence_report(reports):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
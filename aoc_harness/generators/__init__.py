@@ -0,0 +1,61 @@
+"""
+Seeded generators of synthetic puzzle inputs, one ``day_NN`` module per day.
+
+Every module follows its day's input grammar and exposes ``generate(size, rng)``, the
+smallest valid size ``MIN_SIZE``, the starting size of the scaling benchmark ``BENCH_SIZE``
+and ``COMPLEXITY``, the expected growth exponent of each part's run time in ``size``.
+"""
+
+import os
+import random
+import importlib
+from types import ModuleType
+from typing import List
+
+
+def available_days() -> List[int]:
+    """
+    Lists the days that have a generator module.
+
+    Returns:
+    List[int]: Sorted day numbers.
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    return sorted(
+        int(name[len("day_") : -len(".py")])
+        for name in os.listdir(package_dir)
+        if name.startswith("day_") and name.endswith(".py")
+    )
+
+
+def load_generator(day: int) -> ModuleType:
+    """
+    Imports the generator module of a day.
+
+    Args:
+    day (int): The day number.
+
+    Returns:
+    ModuleType: The generator module.
+    """
+    if day not in available_days():
+        raise ValueError(f"No generator for day {day}")
+    return importlib.import_module(f"{__name__}.day_{day:02d}")
+
+
+def generate_input(day: int, size: int, seed: int = 0) -> str:
+    """
+    Generates the input text of a day. The same day, size and seed always give the same text.
+
+    Args:
+    day (int): The day number.
+    size (int): Size of the input, in the unit documented by the day's generator module.
+    seed (int): Seed of the random number generator.
+
+    Returns:
+    str: The generated input, ending with a newline.
+    """
+    generator = load_generator(day)
+    if size < generator.MIN_SIZE:
+        raise ValueError(f"Day {day} needs a size of at least {generator.MIN_SIZE}")
+    return generator.generate(size, random.Random(seed))
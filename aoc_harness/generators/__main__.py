@@ -0,0 +1,48 @@
+import sys
+import argparse
+
+from aoc_harness.generators import available_days, generate_input
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses and returns command line arguments for the input generator.
+
+    Returns:
+    argparse.Namespace: Parsed command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic puzzle input for scale testing."
+    )
+    parser.add_argument(
+        "--day", type=int, required=True, choices=available_days(), help="Day number"
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        required=True,
+        help="Size of the input, see the day's generator module for the unit",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument(
+        "--output", help="File to write the input to (default: standard output)"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_arguments()
+    try:
+        text = generate_input(args.day, args.size, args.seed)
+    except ValueError as e:
+        sys.exit(str(e))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
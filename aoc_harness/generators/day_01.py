@@ -0,0 +1,43 @@
+"""
+Day 1 calibration lines: letters, digits and spelled-out digits, with at least one digit per line.
+
+``size`` is the number of lines.
+"""
+
+import random
+
+MIN_SIZE = 1
+BENCH_SIZE = 2000
+COMPLEXITY = {1: 1.0, 2: 1.0}
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+DIGITS = "123456789"
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates calibration lines.
+
+    Args:
+    size (int): Number of lines.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    lines = []
+    for _ in range(size):
+        tokens = []
+        for _ in range(rng.randint(1, 12)):
+            kind = rng.random()
+            if kind < 0.5:
+                tokens.append(rng.choice(LETTERS))
+            elif kind < 0.75:
+                tokens.append(rng.choice(DIGIT_WORDS))
+            else:
+                tokens.append(rng.choice(DIGITS))
+        # part 1 needs a numeric digit on every line
+        tokens.insert(rng.randint(0, len(tokens)), rng.choice(DIGITS))
+        lines.append("".join(tokens))
+    return "\n".join(lines) + "\n"
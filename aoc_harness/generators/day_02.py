@@ -0,0 +1,34 @@
+"""
+Day 2 games: 'Game N: 3 blue, 4 red; 1 red, 2 green' with one to six draws per game.
+
+``size`` is the number of games.
+"""
+
+import random
+
+MIN_SIZE = 1
+BENCH_SIZE = 1000
+COMPLEXITY = {1: 1.0, 2: 1.0}
+
+COLORS = ["red", "green", "blue"]
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates game records.
+
+    Args:
+    size (int): Number of games.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    lines = []
+    for game_id in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(COLORS, rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: {'; '.join(draws)}")
+    return "\n".join(lines) + "\n"
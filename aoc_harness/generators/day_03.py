@@ -0,0 +1,44 @@
+"""
+Day 3 engine schematic: a square grid of '.', part numbers and symbols.
+
+``size`` is the side length of the grid.
+"""
+
+import random
+
+MIN_SIZE = 1
+BENCH_SIZE = 50
+COMPLEXITY = {1: 2.0, 2: 2.0}
+
+SYMBOLS = "*#+$/@=%&-"
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates an engine schematic.
+
+    Args:
+    size (int): Side length of the grid.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    rows = []
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            kind = rng.random()
+            if kind < 0.15:
+                length = min(rng.randint(1, 3), size - len(row))
+                row.append(str(rng.randint(1, 9)))
+                row.extend(str(rng.randint(0, 9)) for _ in range(length - 1))
+                # numbers on the same row are always separated
+                if len(row) < size:
+                    row.append(".")
+            elif kind < 0.22:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        rows.append("".join(row))
+    return "\n".join(rows) + "\n"
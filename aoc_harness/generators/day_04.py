@@ -0,0 +1,48 @@
+"""
+Day 4 scratchcards: 'Card N: <10 winning numbers> | <25 numbers you have>'.
+
+Most cards win nothing, which keeps the number of copies in part 2 from growing exponentially,
+and no card wins copies of cards past the end of the table. ``size`` is the number of cards.
+"""
+
+import random
+
+MIN_SIZE = 1
+BENCH_SIZE = 1000
+COMPLEXITY = {1: 1.0, 2: 1.0}
+
+WINNING_COUNT = 10
+PLAYER_COUNT = 25
+# chance that a card has any matching numbers, and the most matches it then has
+WIN_CHANCE = 0.3
+MAX_MATCHES = 4
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates scratchcards.
+
+    Args:
+    size (int): Number of cards.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    width = len(str(size))
+    lines = []
+    for card_id in range(1, size + 1):
+        matches = 0
+        if rng.random() < WIN_CHANCE:
+            matches = rng.randint(0, min(MAX_MATCHES, size - card_id))
+        numbers = rng.sample(range(1, 100), WINNING_COUNT + PLAYER_COUNT - matches)
+        winning = numbers[:WINNING_COUNT]
+        player = winning[:matches] + numbers[WINNING_COUNT:]
+        rng.shuffle(player)
+        lines.append(
+            f"Card {card_id:>{width}}: "
+            + " ".join(f"{number:>2}" for number in winning)
+            + " | "
+            + " ".join(f"{number:>2}" for number in player)
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,60 @@
+"""
+Day 5 almanac: ten seed ranges and seven maps that each shuffle the same span of numbers.
+
+Every map splits the span into non-overlapping source ranges and lays their destinations out
+in a shuffled order. ``size`` is the number of ranges per map.
+"""
+
+import random
+
+MIN_SIZE = 1
+BENCH_SIZE = 50
+COMPLEXITY = {1: 1.0, 2: 1.0}
+
+CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+SPAN = 2**32
+SEED_PAIRS = 10
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates an almanac.
+
+    Args:
+    size (int): Number of ranges per map.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    seeds = []
+    for _ in range(SEED_PAIRS):
+        start = rng.randrange(SPAN // 2)
+        seeds += [start, rng.randint(1, SPAN // (4 * SEED_PAIRS))]
+    sections = ["seeds: " + " ".join(map(str, seeds))]
+
+    for source, destination in zip(CATEGORIES, CATEGORIES[1:]):
+        cuts = [0] + sorted(rng.sample(range(1, SPAN), size - 1)) + [SPAN]
+        ranges = [(start, end - start) for start, end in zip(cuts, cuts[1:])]
+        # lay the destination ranges out back to back in a shuffled order
+        order = list(range(size))
+        rng.shuffle(order)
+        lines = []
+        destination_start = 0
+        for index in order:
+            source_start, length = ranges[index]
+            lines.append(f"{destination_start} {source_start} {length}")
+            destination_start += length
+        rng.shuffle(lines)
+        sections.append(f"{source}-to-{destination} map:\n" + "\n".join(lines))
+
+    return "\n\n".join(sections) + "\n"
@@ -0,0 +1,27 @@
+"""
+Day 6 race sheet: a single race whose record can be beaten.
+
+``size`` is the race time; part 1 and part 2 both try every hold time.
+"""
+
+import random
+
+MIN_SIZE = 2
+BENCH_SIZE = 100000
+COMPLEXITY = {1: 1.0, 2: 1.0}
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates a race sheet.
+
+    Args:
+    size (int): The race time.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    best_distance = (size // 2) * (size - size // 2)
+    record = rng.randint(best_distance // 2, best_distance - 1)
+    return f"Time:      {size}\nDistance:  {record}\n"
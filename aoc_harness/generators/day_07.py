@@ -0,0 +1,31 @@
+"""
+Day 7 Camel Cards: one 'HAND BID' line per hand.
+
+``size`` is the number of hands.
+"""
+
+import random
+
+MIN_SIZE = 1
+BENCH_SIZE = 1000
+COMPLEXITY = {1: 1.0, 2: 1.0}
+
+CARDS = "23456789TJQKA"
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates hands and bids.
+
+    Args:
+    size (int): Number of hands.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    lines = [
+        f"{''.join(rng.choices(CARDS, k=5))} {rng.randint(1, 1000)}"
+        for _ in range(size)
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,57 @@
+"""
+Day 8 network: left/right instructions and nodes like 'AAA = (BBB, CCC)'.
+
+Every node ending in A starts a cycle that reaches a node ending in Z and loops back, so
+both parts terminate; AAA reaches ZZZ. ``size`` is the number of nodes.
+"""
+
+import random
+import string
+from itertools import product
+
+MIN_SIZE = 3
+BENCH_SIZE = 500
+MAX_GHOSTS = 6
+# three-letter names that end in neither A nor Z
+MAX_INNER_NODES = 26 * 26 * 24
+COMPLEXITY = {1: 1.0, 2: 1.0}
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates a network.
+
+    Args:
+    size (int): Number of nodes.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    ghosts = min(MAX_GHOSTS, size // 3)
+    inner_count = size - 2 * ghosts
+    if inner_count > MAX_INNER_NODES:
+        raise ValueError(f"Day 8 supports at most {MAX_INNER_NODES + 2 * ghosts} nodes")
+
+    prefixes = ["".join(pair) for pair in product(string.ascii_uppercase, repeat=2)]
+    starts = ["AAA"] + rng.sample([p + "A" for p in prefixes if p != "AA"], ghosts - 1)
+    ends = ["ZZZ"] + rng.sample([p + "Z" for p in prefixes if p != "ZZ"], ghosts - 1)
+    inner = rng.sample(
+        [p + last for p in prefixes for last in string.ascii_uppercase[1:-1]],
+        inner_count,
+    )
+
+    # split the inner nodes into one chain per ghost, each at least one node long
+    cuts = [0] + sorted(rng.sample(range(1, inner_count), ghosts - 1)) + [inner_count]
+    network = {}
+    for start, end, low, high in zip(starts, ends, cuts, cuts[1:]):
+        chain = inner[low:high]
+        path = [start] + chain + [end]
+        for node, next_node in zip(path, path[1:]):
+            network[node] = next_node
+        network[end] = chain[0]
+
+    instructions = "".join(rng.choices("LR", k=rng.randint(2, 300)))
+    lines = [f"{node} = ({target}, {target})" for node, target in network.items()]
+    rng.shuffle(lines)
+    return f"{instructions}\n\n" + "\n".join(lines) + "\n"
@@ -0,0 +1,40 @@
+"""
+Day 9 OASIS report: sequences of 21 values of integer polynomials up to degree 6.
+
+``size`` is the number of sequences.
+"""
+
+import random
+
+MIN_SIZE = 1
+BENCH_SIZE = 500
+COMPLEXITY = {1: 1.0, 2: 1.0}
+
+SEQUENCE_LENGTH = 21
+MAX_DEGREE = 6
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates value histories.
+
+    Args:
+    size (int): Number of sequences.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    lines = []
+    for _ in range(size):
+        coefficients = [
+            rng.randint(-5, 5) for _ in range(rng.randint(1, MAX_DEGREE + 1))
+        ]
+        values = []
+        for x in range(SEQUENCE_LENGTH):
+            value = 0
+            for coefficient in reversed(coefficients):
+                value = value * x + coefficient
+            values.append(value)
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,62 @@
+"""
+Day 10 pipe maze: a square grid with one loop through S and unconnected pipes around it.
+
+The loop snakes through the inner part of the grid, so its length grows with the area.
+``size`` is the side length of the grid.
+"""
+
+import random
+
+MIN_SIZE = 4
+BENCH_SIZE = 40
+COMPLEXITY = {1: 2.0, 2: 2.0}
+
+# pipe connecting a pair of directions, (row, column) steps
+PIPES = {
+    frozenset({(-1, 0), (1, 0)}): "|",
+    frozenset({(0, -1), (0, 1)}): "-",
+    frozenset({(-1, 0), (0, 1)}): "L",
+    frozenset({(-1, 0), (0, -1)}): "J",
+    frozenset({(1, 0), (0, -1)}): "7",
+    frozenset({(1, 0), (0, 1)}): "F",
+}
+JUNK = "|-LJ7F" + "." * 6
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates a pipe maze.
+
+    Args:
+    size (int): Side length of the grid.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    grid = [[rng.choice(JUNK) for _ in range(size)] for _ in range(size)]
+
+    # the loop covers an even-sided square at (1, 1): along the top row, snaking back and
+    # forth through the other rows from column 1, then up column 0
+    side = size - 2 if size % 2 == 0 else size - 3
+    loop = [(0, column) for column in range(side)]
+    for row in range(1, side):
+        columns = range(side - 1, 0, -1) if row % 2 else range(1, side)
+        loop += [(row, column) for column in columns]
+    loop += [(row, 0) for row in range(side - 1, 0, -1)]
+
+    for index, (row, column) in enumerate(loop):
+        previous_row, previous_column = loop[index - 1]
+        next_row, next_column = loop[(index + 1) % len(loop)]
+        directions = frozenset(
+            {
+                (previous_row - row, previous_column - column),
+                (next_row - row, next_column - column),
+            }
+        )
+        grid[row + 1][column + 1] = PIPES[directions]
+
+    grid[1][1] = "S"
+    # keep the tiles outside the loop next to S from connecting to it
+    grid[0][1] = grid[1][0] = "."
+    return "\n".join("".join(row) for row in grid) + "\n"
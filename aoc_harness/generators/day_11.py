@@ -0,0 +1,34 @@
+"""
+Day 11 galaxy image: a square grid of '.' with sparse '#' galaxies.
+
+``size`` is the side length of the grid. The number of galaxies grows with the area and the
+puzzle sums the distance of every pair, hence the exponent of 4.
+"""
+
+import random
+
+MIN_SIZE = 2
+BENCH_SIZE = 50
+COMPLEXITY = {1: 4.0, 2: 4.0}
+
+GALAXY_DENSITY = 0.02
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates a galaxy image.
+
+    Args:
+    size (int): Side length of the grid.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    grid = [
+        ["#" if rng.random() < GALAXY_DENSITY else "." for _ in range(size)]
+        for _ in range(size)
+    ]
+    # at least one pair of galaxies
+    grid[0][0] = grid[size - 1][size - 1] = "#"
+    return "\n".join("".join(row) for row in grid) + "\n"
@@ -0,0 +1,42 @@
+"""
+Day 12 spring records: a row of '.', '#' and '?' followed by its damaged group sizes.
+
+Every row has at least one valid arrangement and at most MAX_UNKNOWN '?' springs, so the
+work per row is bounded. ``size`` is the number of rows.
+"""
+
+import random
+
+MIN_SIZE = 1
+BENCH_SIZE = 500
+COMPLEXITY = {1: 1.0, 2: 1.0}
+
+MAX_UNKNOWN = 12
+
+
+def generate(size: int, rng: random.Random) -> str:
+    """
+    Generates spring records.
+
+    Args:
+    size (int): Number of rows.
+    rng (random.Random): Seeded random number generator.
+
+    Returns:
+    str: The input text.
+    """
+    lines = []
+    for _ in range(size):
+        springs = "." * rng.randint(0, 2)
+        groups = []
+        for _ in range(rng.randint(1, 5)):
+            groups.append(rng.randint(1, 5))
+            springs += "#" * groups[-1] + "." * rng.randint(1, 3)
+
+        # hide a bounded number of springs
+        hidden = rng.sample(range(len(springs)), min(MAX_UNKNOWN, len(springs) // 2))
+        row = list(springs)
+        for index in hidden:
+            row[index] = "?"
+        lines.append(f"{''.join(row)} {','.join(map(str, groups))}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,2378 @@
+from __future__ import annotations
+
+import io
+import os
+import sys
+import time
+from functools import lru_cache, wraps
+from collections import defaultdict, namedtuple
+
+# Every day imports this module at startup, so anything beyond the essentials (colorama and
+# argparse included) is imported by the function that needs it; see aoc_harness.startup.
+# typing is only needed by type checkers, which treat this constant like typing.TYPE_CHECKING.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Callable,
+        ContextManager,
+        Dict,
+        Iterator,
+        List,
+        Optional,
+        Tuple,
+        Union,
+    )
+
+    import ast
+    import argparse
+    import pstats
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+# Global variables
+debug_mode = False
+debug_helper_mode = False
+debug_solution_mode = False
+output_format = "text"
+color_enabled = None  # decided on the first coloured print, see use_color
+
+# Structured output settings, see emit_result_record
+OUTPUT_FORMATS = ("text", "json", "csv")
+RECORD_FIELDS = (
+    "day",
+    "source",
+    "part",
+    "result",
+    "expected",
+    "passed",
+    "cached",
+    "parse_time",
+    "exec_time",
+    "min",
+    "median",
+    "p95",
+    "stddev",
+    "peak_memory",
+    "retained_memory",
+    "retained_blocks",
+    "regression",
+)
+csv_header_written = False
+
+# Result cache settings
+CACHE_DIR_NAME = ".aoc_cache"
+CACHE_MAX_ENTRIES = 128
+HISTORY_FILE_NAME = "history.jsonl"
+EXAMPLES_FILE_NAME = "examples.json"
+
+# Line between the example data and the answers in example.txt
+EXAMPLE_SEPARATOR = "-" * 80
+
+# Polling interval of --watch in seconds
+WATCH_INTERVAL = 0.2
+
+# Ways the input can be handed to the solutions, see load_input
+INPUT_MODES = ("lines", "stream", "mmap")
+
+# Functions registered with strip_debug: [module globals, name, original, fast variant or None]
+debug_variants = []
+
+
+# Common functions
+def verify_input_file(is_example: bool) -> None:
+    """
+    Verifies the existence of the required input file and prints an entertaining message if not found.
+
+    Args:
+    is_example (bool): Flag to indicate whether the script is running in example mode.
+    """
+    file_name = "example.txt" if is_example else "input.txt"
+
+    if not os.path.exists(file_name):
+        print_separator()
+        if is_example:
+            print(red_text("Oops! The example file is playing hide and seek! 🙈"))
+            print(
+                yellow_text(
+                    "Use the 'aocd' package to fetch example.txt. Visit: https://pypi.org/project/advent-of-code-data/"
+                )
+            )
+        else:
+            print(red_text("Oops! The input file seems to have run off!"))
+            print(yellow_text("Please grab the input from https://adventofcode.com."))
+        print_separator()
+        print(green_text("Need help? Try running: python solution.py --help"))
+        print_separator()
+        exit(1)
+
+
+def read_input(source: str, is_file: bool = True) -> List[str]:
+    """
+    Reads input data from a file or a string.
+
+    Args:
+    source (str): Path to the input file or a string containing the input.
+    is_file (bool): Flag to indicate whether the source is a file path or a string.
+
+    Returns:
+    List[str]: A list of lines from the input source.
+    """
+    if is_file:
+        with open(source, "r") as file:
+            return [line.strip() for line in file]
+    else:
+        return [line.strip() for line in source.splitlines()]
+
+
+class LineStream:
+    """
+    Lazily yields stripped lines from a file or a string.
+
+    Every iteration reads the source again, so one stream can be handed to both parts
+    (and to repeated benchmark runs) without ever materialising a list of lines.
+    """
+
+    def __init__(self, source: str, is_file: bool = True) -> None:
+        self.source = source
+        self.is_file = is_file
+
+    def __iter__(self) -> Iterator[str]:
+        with (
+            open(self.source, "r") if self.is_file else io.StringIO(self.source)
+        ) as file:
+            for line in file:
+                yield line.strip()
+
+
+def read_input_stream(source: str, is_file: bool = True) -> LineStream:
+    """
+    Reads input data lazily, one line at a time.
+
+    Args:
+    source (str): Path to the input file or a string containing the input.
+    is_file (bool): Flag to indicate whether the source is a file path or a string.
+
+    Returns:
+    LineStream: A re-iterable stream of stripped lines.
+    """
+    return LineStream(source, is_file)
+
+
+def read_input_buffer(source: str, is_file: bool = True) -> memoryview:
+    """
+    Exposes the raw input bytes without copying them, memory-mapping the file when reading from disk.
+
+    Args:
+    source (str): Path to the input file or a string containing the input.
+    is_file (bool): Flag to indicate whether the source is a file path or a string.
+
+    Returns:
+    memoryview: A read-only view of the input bytes.
+    """
+    import mmap
+
+    if not is_file:
+        return memoryview(source.encode())
+
+    with open(source, "rb") as file:
+        # Empty files can't be mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def load_input(
+    source: str, input_mode: str = "lines", is_file: bool = True
+) -> Union[List[str], LineStream, memoryview]:
+    """
+    Reads input data in the requested input mode.
+
+    Args:
+    source (str): Path to the input file or a string containing the input.
+    input_mode (str): 'lines' for a list of lines, 'stream' for a lazy line stream or 'mmap' for the raw bytes.
+    is_file (bool): Flag to indicate whether the source is a file path or a string.
+
+    Returns:
+    Union[List[str], LineStream, memoryview]: The input data in the requested form.
+    """
+    if input_mode == "stream":
+        return read_input_stream(source, is_file)
+    if input_mode == "mmap":
+        return read_input_buffer(source, is_file)
+    return read_input(source, is_file)
+
+
+def profile(func: Callable) -> Callable:
+    """
+    A decorator to profile the execution time of a function using a monotonic high-resolution clock.
+
+    Args:
+    func (Callable): The function to be profiled.
+
+    Returns:
+    Callable: The wrapped function.
+    """
+
+    fast_func = None
+    preloaded = False
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal fast_func, preloaded
+        if not preloaded:
+            import_preloads(func)
+            preloaded = True
+        # Debug branches only exist in the original; pick the variant once per call. The
+        # stripped variant is compiled on first use, outside the timer, not at import time.
+        if debug_solution_mode:
+            target = func
+        else:
+            if fast_func is None:
+                fast_func = compile_without_debug(func)
+                # helpers registered with strip_debug are compiled before the clock starts too
+                bind_debug_variants()
+            target = fast_func
+        start_time = time.perf_counter()
+        result = target(*args, **kwargs)
+        end_time = time.perf_counter()
+        exec_time = end_time - start_time
+        return result, exec_time
+
+    return wrapper
+
+
+def preload(*module_names: str) -> Callable:
+    """
+    A decorator naming optional modules a function imports itself, e.g. NumPy.
+
+    profile imports them before its first timed call, so the import cost shows up in neither
+    the day's startup time nor its measurements. Modules that aren't installed are skipped.
+
+    Args:
+    module_names (str): Names of the modules to import.
+
+    Returns:
+    Callable: The decorator, which returns the function unchanged.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func.preload_modules = module_names
+        return func
+
+    return decorator
+
+
+def import_preloads(func: Callable) -> None:
+    """
+    Imports the modules a function registered with preload.
+
+    Args:
+    func (Callable): The function to prepare.
+    """
+    import importlib
+
+    for module_name in getattr(func, "preload_modules", ()):
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+
+def is_debug_flag(node: ast.expr) -> bool:
+    """
+    Checks whether an expression is a plain read of the solution debug flag.
+
+    Args:
+    node (ast.expr): The expression to check.
+
+    Returns:
+    bool: True for 'helper.debug_solution_mode' or a bare 'debug_solution_mode'.
+    """
+    import ast
+
+    if isinstance(node, ast.Attribute):
+        return node.attr == "debug_solution_mode" and isinstance(node.value, ast.Name)
+    return isinstance(node, ast.Name) and node.id == "debug_solution_mode"
+
+
+def strip_debug_branches(tree: ast.AST) -> ast.AST:
+    """
+    Removes 'if helper.debug_solution_mode:' blocks from a syntax tree, keeping their else
+    branch if there is one.
+
+    Args:
+    tree (ast.AST): The syntax tree to strip, modified in place.
+
+    Returns:
+    ast.AST: The stripped tree.
+    """
+    import ast
+
+    class DebugBranchStripper(ast.NodeTransformer):
+        def visit_If(self, node: ast.If):
+            self.generic_visit(node)
+            if is_debug_flag(node.test):
+                return node.orelse or ast.Pass()
+            return node
+
+    return ast.fix_missing_locations(DebugBranchStripper().visit(tree))
+
+
+def reads_debug_flag(code: Any) -> bool:
+    """
+    Checks whether a code object, or any function nested in it, names the solution debug flag.
+
+    Args:
+    code (Any): The code object to check.
+
+    Returns:
+    bool: True if 'debug_solution_mode' is among the names it uses.
+    """
+    if "debug_solution_mode" in code.co_names:
+        return True
+    return any(
+        reads_debug_flag(const)
+        for const in code.co_consts
+        if hasattr(const, "co_names")
+    )
+
+
+def compile_without_debug(func: Callable) -> Callable:
+    """
+    Compiles a variant of a function with all of its debug branches removed.
+
+    Nested functions are stripped too. Returns the original function when it never reads the
+    flag, when its source isn't available or when it closes over variables of an enclosing
+    function.
+
+    Args:
+    func (Callable): The function to strip.
+
+    Returns:
+    Callable: The stripped function, or func itself if it can't be stripped.
+    """
+    import ast
+
+    # checked before importing inspect, most solvers have nothing to strip
+    if func.__code__.co_freevars or not reads_debug_flag(func.__code__):
+        return func
+
+    import inspect
+    import textwrap
+
+    try:
+        source = textwrap.dedent(inspect.getsource(func))
+        source_file = inspect.getsourcefile(func)
+    except (OSError, TypeError):
+        return func
+
+    tree = ast.parse(source)
+    function_node = tree.body[0]
+    if not isinstance(function_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return func
+
+    function_node.decorator_list = []
+    tree = strip_debug_branches(tree)
+    ast.increment_lineno(tree, func.__code__.co_firstlineno - 1)
+
+    namespace = {}
+    exec(compile(tree, source_file, "exec"), func.__globals__, namespace)
+    fast_func = namespace[function_node.name]
+    fast_func.__defaults__ = func.__defaults__
+    fast_func.__kwdefaults__ = func.__kwdefaults__
+    return fast_func
+
+
+def strip_debug(func: Callable) -> Callable:
+    """
+    A decorator for helper functions that check the debug flag on every call.
+
+    The module name is bound straight to a variant without debug branches, and rebound to the
+    original when parse_arguments enables solution debugging, so normal runs pay nothing. The
+    variant is compiled on the first call (or by parse_arguments), not at import time.
+
+    Args:
+    func (Callable): The function to strip.
+
+    Returns:
+    Callable: A stand-in that binds the variant matching the debug mode and calls it.
+    """
+    variant = [func.__globals__, func.__name__, func, None]
+    debug_variants.append(variant)
+
+    @wraps(func)
+    def bind_on_first_call(*args, **kwargs):
+        bind_debug_variant(variant)
+        return variant[0][variant[1]](*args, **kwargs)
+
+    return bind_on_first_call
+
+
+def bind_debug_variant(variant: List[Any]) -> None:
+    """
+    Rebinds a function registered with strip_debug to the variant matching the debug mode.
+
+    Args:
+    variant (List[Any]): The registered (module globals, name, original, fast variant) entry.
+    """
+    module_globals, name, func, fast_func = variant
+    if debug_solution_mode:
+        module_globals[name] = func
+        return
+    if fast_func is None:
+        fast_func = variant[3] = compile_without_debug(func)
+    module_globals[name] = fast_func
+
+
+def bind_debug_variants() -> None:
+    """
+    Rebinds every function registered with strip_debug to the variant matching the debug mode.
+    """
+    for variant in debug_variants:
+        bind_debug_variant(variant)
+
+
+def execute_solutions(
+    solution_p1: Callable,
+    solution_p2: Callable,
+    data: List[str],
+    args: argparse.Namespace,
+    answer_a: Optional[str] = None,
+    answer_b: Optional[str] = None,
+    is_example: bool = False,
+    parse: Optional[Callable] = None,
+    input_file: Optional[str] = None,
+    source: str = "input",
+    outcomes: Optional[Dict[int, "PartOutcome"]] = None,
+) -> Tuple[bool, bool]:
+    """
+    Executes the provided solution functions and checks their results.
+
+    Args:
+    solution_p1 (Callable): Function for solution part 1.
+    solution_p2 (Callable): Function for solution part 2.
+    data (List[str]): Input data for the puzzle.
+    args (argparse.Namespace): Parsed command line arguments.
+    answer_a (Optional[str]): Expected answer for part 1 in example mode.
+    answer_b (Optional[str]): Expected answer for part 2 in example mode.
+    is_example (bool): Flag to indicate example mode.
+    parse (Optional[Callable]): Optional function that parses the input once for both parts.
+    input_file (Optional[str]): Path of the input file, enables the result cache and run history when given.
+    source (str): Label of the data in structured output, e.g. 'input' or 'example 2'.
+    outcomes (Optional[Dict[int, PartOutcome]]): Results already computed by workers, by part;
+        the parts aren't run again.
+
+    Returns:
+    Tuple[bool, bool]: Tuple indicating whether each solution part returned None.
+    """
+    parts = []
+    if args.p1 or not (args.p1 or args.p2):
+        parts.append((1, solution_p1, answer_a))
+    if args.p2 or not (args.p1 or args.p2):
+        parts.append((2, solution_p2, answer_b))
+
+    use_cache = (
+        input_file is not None
+        and not args.no_cache
+        and args.bench == 0
+        and not args.mem
+        and not args.profile_out
+        # debug output only comes from actually running the parse hook and solvers
+        and not (debug_solution_mode or debug_helper_mode)
+        # a cached result has no fresh timing to compare against the baseline
+        and not args.compare
+    )
+    input_hash = hash_file(input_file) if input_file is not None else None
+    history_file = (
+        os.path.join(result_cache_dir(input_file), HISTORY_FILE_NAME)
+        if input_file is not None
+        else None
+    )
+    no_solution = {1: False, 2: False}
+    parse_status = None
+
+    for part, solution_func, expected_answer in parts:
+        cache = None
+        if use_cache:
+            cache_key = result_cache_key(
+                solution_func, (solution_p1, solution_p2), input_hash, part
+            )
+            cache = (result_cache_dir(input_file), cache_key)
+            if output_format != "text":
+                entry = lookup_cached_result(cache)
+                if entry is not None:
+                    emit_result_record(
+                        solution_day(solution_func),
+                        source,
+                        part,
+                        entry["result"],
+                        exec_time=entry["exec_time"],
+                        cached=True,
+                    )
+                    continue
+            elif print_cached_solution(cache, part):
+                continue
+
+        # Parse lazily so fully cached runs skip the parser as well
+        parse_time = None
+        if parse is not None:
+            with solver_output():
+                if outcomes is not None:
+                    print(outcomes[part].parse_output, end="")
+                    parse_time = outcomes[part].parse_time
+                elif args.timeout or args.max_memory:
+                    # the parsed data comes back from the child process through a pipe
+                    data, parse_time, parse_status = run_guarded_solution(
+                        profile(parse), data, args.timeout, args.max_memory
+                    )
+                else:
+                    data, parse_time = profile(parse)(data)
+            if parse_status is None:
+                print_parse_result(parse_time)
+            parse = None
+
+        # a parse hook stopped by the limits fails every part that needs its data
+        if parse_status is not None:
+            print_guard_failure(
+                solution_func,
+                part,
+                parse_status,
+                args,
+                expected_answer,
+                is_example,
+                source,
+            )
+            continue
+
+        if outcomes is not None:
+            with solver_output():
+                print(outcomes[part].output, end="")
+        no_solution[part] |= execute_and_print_solution(
+            solution_func,
+            data,
+            expected_answer,
+            part=part,
+            is_example=is_example,
+            args=args,
+            cache=cache,
+            history=(history_file, input_hash) if history_file else None,
+            source=source,
+            parse_time=parse_time,
+            outcome=outcomes[part][:2] if outcomes is not None else None,
+        )
+
+    return no_solution[1], no_solution[2]
+
+
+def execute_and_print_solution(
+    solution_func: Callable,
+    data: List[str],
+    expected_answer: Optional[str],
+    part: int,
+    is_example: bool = False,
+    args: Optional[argparse.Namespace] = None,
+    cache: Optional[Tuple[str, str]] = None,
+    history: Optional[Tuple[str, str]] = None,
+    source: str = "input",
+    parse_time: Optional[float] = None,
+    outcome: Optional[Tuple[Any, float]] = None,
+) -> bool:
+    """
+    Executes a solution function, prints the result, and checks if the result is None.
+
+    Args:
+    solution_func (Callable): The solution function to execute.
+    data (List[str]): Input data for the puzzle.
+    expected_answer (Optional[str]): The expected answer for comparison.
+    part (int): The part number of the puzzle (1 or 2).
+    is_example (bool): Flag to indicate if it's an example run.
+    args (Optional[argparse.Namespace]): Parsed command line arguments.
+    cache (Optional[Tuple[str, str]]): Cache directory and key to store the result under.
+    history (Optional[Tuple[str, str]]): History file and input hash to record the run under.
+    source (str): Label of the data in structured output, e.g. 'input' or 'example 2'.
+    parse_time (Optional[float]): Time spent in the parse hook before this part, if it ran.
+    outcome (Optional[Tuple[Any, float]]): Result and execution time already computed by a worker.
+
+    Returns:
+    bool: True if the solution returned None, False otherwise.
+    """
+    timing_stats = None
+    if outcome is not None:
+        result, exec_time = outcome
+    elif args is not None and args.bench > 0:
+        with solver_output():
+            result, timings, status = benchmark_solution(
+                solution_func,
+                data,
+                repeats=args.bench,
+                warmup=args.warmup,
+                timeout=args.timeout,
+                max_memory=args.max_memory,
+            )
+        if status is not None:
+            print_guard_failure(
+                solution_func, part, status, args, expected_answer, is_example, source
+            )
+            return False
+        timing_stats = summarize_timings(timings)
+        exec_time = timing_stats["median"]
+    elif args is not None and (args.timeout or args.max_memory):
+        with solver_output():
+            result, exec_time, status = run_guarded_solution(
+                solution_func, data, args.timeout, args.max_memory
+            )
+        if status is not None:
+            print_guard_failure(
+                solution_func, part, status, args, expected_answer, is_example, source
+            )
+            return False
+    else:
+        with solver_output():
+            result, exec_time = solution_func(data)
+
+    mem_stats = None
+    if args is not None and args.mem:
+        with solver_output():
+            mem_stats = measure_memory(solution_func, data)
+
+    if args is not None and args.profile_out:
+        with solver_output():
+            profile_solution(solution_func, data, args.profile_out, part, is_example)
+
+    # Recorded before printing so structured output can carry the regression flag
+    comparison = None
+    if history is not None and result is not None:
+        history_file, input_hash = history
+        record = build_history_record(
+            solution_func, part, input_hash, exec_time, timing_stats, mem_stats
+        )
+        if args.compare:
+            comparison = compare_to_baseline(history_file, record, args.baseline_runs)
+        append_history(history_file, record)
+    regression = (
+        comparison[0] > args.compare_threshold if comparison is not None else None
+    )
+
+    if output_format != "text":
+        emit_result_record(
+            solution_day(solution_func),
+            source,
+            part,
+            result,
+            expected_answer if is_example else None,
+            exec_time,
+            parse_time=parse_time,
+            timing_stats=timing_stats,
+            mem_stats=mem_stats,
+            regression=regression,
+        )
+    elif is_example and expected_answer is None:
+        print(f"Solution Part {part}: No answer provided in example.txt")
+    elif result is None:
+        print_separator()
+        print(f"Solution Part {part}: returns {red_text('None')}.")
+    elif is_example:
+        print_example_result(
+            result, expected_answer, exec_time, part, timing_stats, mem_stats
+        )
+    else:
+        print_solution_result(
+            result, exec_time, part, timing_stats, mem_stats=mem_stats
+        )
+        if history is not None and args.compare:
+            print_regression_check(part, comparison, args.compare_threshold)
+
+    if is_example and expected_answer is None:
+        return False
+
+    if result is None:
+        return True  # Return True if result is None
+    else:
+        if cache is not None:
+            store_cached_result(*cache, result, exec_time)
+        return False  # Return False if result is not None
+
+
+def solver_output() -> ContextManager:
+    """
+    Sends what parse hooks and solvers print to stderr while --format json/csv records are
+    printed, so stdout only carries records.
+
+    Returns:
+    ContextManager: The redirection, or a no-op for the text report.
+    """
+    from contextlib import nullcontext, redirect_stdout
+
+    if output_format != "text":
+        return redirect_stdout(sys.stderr)
+    return nullcontext()
+
+
+def solution_day(solution_func: Callable) -> str:
+    """
+    Returns the name of the day directory a solution function is defined in.
+
+    Args:
+    solution_func (Callable): The (possibly profiled) solution function.
+
+    Returns:
+    str: The day directory name, e.g. 'day_03'.
+    """
+    import inspect
+
+    func = inspect.unwrap(solution_func)
+    return os.path.basename(
+        os.path.dirname(os.path.abspath(inspect.getsourcefile(func)))
+    )
+
+
+def emit_result_record(
+    day: str,
+    source: str,
+    part: int,
+    result: Any,
+    expected: Optional[str] = None,
+    exec_time: Optional[float] = None,
+    parse_time: Optional[float] = None,
+    timing_stats: Optional[Dict[str, float]] = None,
+    mem_stats: Optional[Dict[str, int]] = None,
+    cached: bool = False,
+    regression: Optional[bool] = None,
+) -> None:
+    """
+    Prints one structured result record in the selected --format (a JSON line or a CSV row).
+
+    The CSV header is printed once, before the first row.
+
+    Args:
+    day (str): The day directory name.
+    source (str): Label of the data, e.g. 'input' or 'example 2'.
+    part (int): The part number of the puzzle (1 or 2).
+    result (Any): The result of the solution function.
+    expected (Optional[str]): The expected answer, if known.
+    exec_time (Optional[float]): The execution time of the solution function.
+    parse_time (Optional[float]): Time spent in the parse hook before this part, if it ran.
+    timing_stats (Optional[Dict[str, float]]): Benchmark statistics, if benchmarking was enabled.
+    mem_stats (Optional[Dict[str, int]]): Memory statistics, if memory tracing was enabled.
+    cached (bool): Flag to indicate the result was served from the result cache.
+    regression (Optional[bool]): Whether the run is slower than its --compare baseline; None without a baseline.
+    """
+    import csv
+    import json
+
+    global csv_header_written
+    timing_stats = timing_stats or {}
+    mem_stats = mem_stats or {}
+    record = {
+        "day": day,
+        "source": source,
+        "part": part,
+        "result": None if result is None else str(result),
+        "expected": expected,
+        "passed": (
+            None if expected is None else result is not None and str(result) == expected
+        ),
+        "cached": cached,
+        "parse_time": parse_time,
+        "exec_time": exec_time,
+        "min": timing_stats.get("min"),
+        "median": timing_stats.get("median"),
+        "p95": timing_stats.get("p95"),
+        "stddev": timing_stats.get("stddev"),
+        "peak_memory": mem_stats.get("peak"),
+        "retained_memory": mem_stats.get("retained"),
+        "retained_blocks": mem_stats.get("blocks"),
+        "regression": regression,
+    }
+
+    if output_format == "json":
+        print(json.dumps(record), flush=True)
+        return
+
+    writer = csv.DictWriter(sys.stdout, fieldnames=RECORD_FIELDS)
+    if not csv_header_written:
+        writer.writeheader()
+        csv_header_written = True
+    writer.writerow(record)
+    sys.stdout.flush()
+
+
+@lru_cache(maxsize=None)
+def git_revision(directory: str) -> str:
+    """
+    Returns the short git revision of the checkout containing a directory.
+
+    Args:
+    directory (str): A directory inside the checkout.
+
+    Returns:
+    str: The short commit hash, or 'unknown' outside of a git checkout.
+    """
+    import subprocess
+
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=directory,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return completed.stdout.strip()
+
+
+def build_history_record(
+    solution_func: Callable,
+    part: int,
+    input_hash: str,
+    exec_time: float,
+    timing_stats: Optional[Dict[str, float]] = None,
+    mem_stats: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
+    """
+    Builds the run history record of a solution part.
+
+    Args:
+    solution_func (Callable): The profiled solution function.
+    part (int): The part number of the puzzle (1 or 2).
+    input_hash (str): Digest of the input file.
+    exec_time (float): The execution time of the solution function.
+    timing_stats (Optional[Dict[str, float]]): Benchmark statistics, if benchmarking was enabled.
+    mem_stats (Optional[Dict[str, int]]): Memory statistics, if memory tracing was enabled.
+
+    Returns:
+    Dict[str, Any]: The history record.
+    """
+    import inspect
+
+    day_dir = os.path.dirname(
+        os.path.abspath(inspect.getsourcefile(inspect.unwrap(solution_func)))
+    )
+    return {
+        "timestamp": time.time(),
+        "day": solution_day(solution_func),
+        "part": part,
+        "revision": git_revision(day_dir),
+        "input_hash": input_hash,
+        "exec_time": exec_time,
+        "timing_stats": timing_stats,
+        "peak_memory": mem_stats["peak"] if mem_stats else None,
+    }
+
+
+def load_history(history_file: str) -> List[Dict[str, Any]]:
+    """
+    Loads all records from a run history file.
+
+    Args:
+    history_file (str): Path of the history file.
+
+    Returns:
+    List[Dict[str, Any]]: The records in the order they were recorded.
+    """
+    import json
+
+    records = []
+    try:
+        with open(history_file, "r") as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue  # skip lines from interrupted writes
+    except OSError:
+        pass
+    return records
+
+
+def append_history(history_file: str, record: Dict[str, Any]) -> None:
+    """
+    Appends a record to a run history file.
+
+    Args:
+    history_file (str): Path of the history file.
+    record (Dict[str, Any]): The record to append.
+    """
+    import json
+
+    os.makedirs(os.path.dirname(history_file), exist_ok=True)
+    with open(history_file, "a") as file:
+        file.write(json.dumps(record) + "\n")
+
+
+def compare_to_baseline(
+    history_file: str, record: Dict[str, Any], baseline_runs: int
+) -> Optional[Tuple[float, float, int]]:
+    """
+    Compares a run against the rolling baseline of earlier runs on the same day, part and input.
+
+    The baseline is the median execution time of the last baseline_runs matching records.
+
+    Args:
+    history_file (str): Path of the history file.
+    record (Dict[str, Any]): The record of the current run.
+    baseline_runs (int): Number of earlier runs the baseline is computed from.
+
+    Returns:
+    Optional[Tuple[float, float, int]]: The relative change against the baseline, the baseline
+    and the number of runs it was computed from, or None if no run was recorded yet.
+    """
+    import statistics
+
+    previous = [
+        entry["exec_time"]
+        for entry in load_history(history_file)
+        if entry.get("day") == record["day"]
+        and entry.get("part") == record["part"]
+        and entry.get("input_hash") == record["input_hash"]
+    ][-baseline_runs:]
+
+    if not previous:
+        return None
+
+    baseline = statistics.median(previous)
+    change = (record["exec_time"] - baseline) / baseline if baseline > 0 else 0.0
+    return change, baseline, len(previous)
+
+
+def print_regression_check(
+    part: int, comparison: Optional[Tuple[float, float, int]], threshold: float
+) -> None:
+    """
+    Prints whether a run is slower than its baseline by more than the threshold.
+
+    Args:
+    part (int): The part number of the puzzle (1 or 2).
+    comparison (Optional[Tuple[float, float, int]]): The result of compare_to_baseline.
+    threshold (float): Allowed slowdown as a fraction of the baseline, e.g. 0.1 for 10%.
+    """
+    if comparison is None:
+        print(yellow_text(f"Part {part}: no baseline recorded yet."))
+        return
+
+    change, baseline, runs = comparison
+    summary = f"{change:+.1%} vs baseline '{baseline:.6f}' seconds over {runs} runs"
+    if change > threshold:
+        print(red_text(f"Part {part}: REGRESSION {summary}."))
+    else:
+        print(green_text(f"Part {part}: OK {summary}."))
+
+
+def measure_memory(solution_func: Callable, data: List[str]) -> Dict[str, int]:
+    """
+    Runs a solution function once more under tracemalloc and records its memory usage.
+
+    The traced run is separate from the timed run so tracing overhead doesn't skew the execution time.
+
+    Args:
+    solution_func (Callable): The profiled solution function.
+    data (List[str]): Input data for the puzzle.
+
+    Returns:
+    Dict[str, int]: Peak traced memory in bytes, plus the number and size of the blocks still allocated afterwards.
+    """
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        solution_func(data)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Ignore the bookkeeping of tracemalloc itself
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    retained = after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), "filename"
+    )
+    return {
+        "peak": peak,
+        "blocks": sum(max(stat.count_diff, 0) for stat in retained),
+        "retained": sum(max(stat.size_diff, 0) for stat in retained),
+    }
+
+
+def format_memory_stats(mem_stats: Dict[str, int]) -> str:
+    """
+    Formats memory statistics for display.
+
+    Args:
+    mem_stats (Dict[str, int]): Statistics as returned by measure_memory.
+
+    Returns:
+    str: The formatted statistics.
+    """
+    peak_kib = mem_stats["peak"] / 1024
+    retained_kib = mem_stats["retained"] / 1024
+    return (
+        f"Peak Memory: '{green_text(f'{peak_kib:.1f}')}' KiB | "
+        f"Retained: '{retained_kib:.1f}' KiB in '{mem_stats['blocks']}' blocks."
+    )
+
+
+def profile_solution(
+    solution_func: Callable,
+    data: List[str],
+    output_dir: str,
+    part: int,
+    is_example: bool = False,
+) -> None:
+    """
+    Runs a solution function once more under cProfile and writes a .pstats and a collapsed-stack file.
+
+    Files are named after the day directory and part, e.g. 'day_03_p1.pstats' and 'day_03_p1.collapsed'.
+
+    Args:
+    solution_func (Callable): The profiled solution function.
+    data (List[str]): Input data for the puzzle.
+    output_dir (str): Directory the profile files are written to.
+    part (int): The part number of the puzzle (1 or 2).
+    is_example (bool): Flag to indicate if it's an example run.
+    """
+    import inspect
+    import cProfile
+    import pstats
+
+    func = inspect.unwrap(solution_func)
+    day = solution_day(solution_func)
+    base_name = f"{day}{'_example' if is_example else ''}_p{part}"
+
+    profiler = cProfile.Profile()
+    profiler.runcall(func, data)
+
+    os.makedirs(output_dir, exist_ok=True)
+    base_path = os.path.join(output_dir, base_name)
+    profiler.dump_stats(f"{base_path}.pstats")
+    write_collapsed_stacks(pstats.Stats(profiler), f"{base_path}.collapsed")
+
+    if debug_helper_mode:
+        print(f"{green_text('Profile written:')} {base_path}.pstats")
+
+
+def write_collapsed_stacks(stats: pstats.Stats, file_path: str) -> None:
+    """
+    Writes profile statistics as collapsed stacks ('a;b;c <microseconds>') for flamegraph tools.
+
+    cProfile only records caller/callee edges, so each function's self time is split across
+    its call paths in proportion to the time spent through each caller.
+
+    Args:
+    stats (pstats.Stats): The profile statistics.
+    file_path (str): Path of the collapsed-stack file to write.
+    """
+    entries = stats.stats
+    callees = defaultdict(list)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller in callers:
+            callees[caller].append(func)
+
+    def label(func):
+        file_name, line, name = func
+        if file_name == "~":
+            return name
+        return f"{name} ({os.path.basename(file_name)}:{line})"
+
+    folded = defaultdict(int)
+
+    def walk(func, stack, scale):
+        total_time = entries[func][2]
+        self_time = int(round(total_time * scale * 1e6))
+        if self_time:
+            folded[";".join(label(frame) for frame in stack)] += self_time
+
+        for callee in callees[func]:
+            callee_cumulative = entries[callee][3]
+            if callee in stack or callee_cumulative <= 0:
+                continue
+            edge_cumulative = entries[callee][4][func][3]
+            walk(callee, stack + [callee], scale * edge_cumulative / callee_cumulative)
+
+    for func, (_, _, _, _, callers) in entries.items():
+        if not callers:
+            walk(func, [func], 1.0)
+
+    with open(file_path, "w") as file:
+        for stack, micros in sorted(folded.items()):
+            file.write(f"{stack} {micros}\n")
+
+
+def print_parse_result(parse_time: float) -> None:
+    """
+    Prints the execution time of the shared input parser.
+
+    Args:
+    parse_time (float): The execution time of the parse function.
+    """
+    if output_format != "text":
+        return
+    print_separator()
+    print(f"Parse: Execution Time: '{green_text(f'{parse_time:.6f}')}' seconds.")
+
+
+def hash_file(file_path: str) -> str:
+    """
+    Computes the SHA-256 digest of a file's content.
+
+    Args:
+    file_path (str): Path to the file.
+
+    Returns:
+    str: The hex digest of the file content.
+    """
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def result_cache_dir(input_file: str) -> str:
+    """
+    Returns the result cache directory, which lives next to the input file.
+
+    Args:
+    input_file (str): Path of the input file.
+
+    Returns:
+    str: Path of the cache directory.
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(input_file)), CACHE_DIR_NAME)
+
+
+def result_cache_key(
+    solution_func: Callable,
+    solution_funcs: Tuple[Callable, ...],
+    input_hash: str,
+    part: int,
+) -> str:
+    """
+    Builds the cache key of a solution part from its source and its input.
+
+    The source hash covers the whole solution module except the other parts, so editing
+    one part (or a shared helper function) only invalidates the parts it can affect.
+
+    Args:
+    solution_func (Callable): The profiled solution function.
+    solution_funcs (Tuple[Callable, ...]): All solution parts of the module.
+    input_hash (str): Digest of the input file.
+    part (int): The part number of the puzzle (1 or 2).
+
+    Returns:
+    str: The cache key.
+    """
+    return f"{part_source_hash(solution_func, solution_funcs)}:{input_hash}:p{part}"
+
+
+def part_source_hash(
+    solution_func: Callable, solution_funcs: Tuple[Callable, ...]
+) -> str:
+    """
+    Hashes the source a solution part depends on: its module without the other parts.
+
+    Args:
+    solution_func (Callable): The profiled solution function.
+    solution_funcs (Tuple[Callable, ...]): All solution parts of the module.
+
+    Returns:
+    str: Hex digest of the source.
+    """
+    import hashlib
+    import inspect
+
+    source = inspect.getsource(inspect.getmodule(inspect.unwrap(solution_func)))
+    for other_func in solution_funcs:
+        if other_func is not solution_func:
+            source = source.replace(inspect.getsource(inspect.unwrap(other_func)), "")
+
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def load_result_cache(cache_dir: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Loads the on-disk result cache.
+
+    Args:
+    cache_dir (str): Path of the cache directory.
+
+    Returns:
+    Dict[str, Dict[str, Any]]: Cache entries by key, empty if there is no usable cache.
+    """
+    import json
+
+    try:
+        with open(os.path.join(cache_dir, "results.json"), "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_result_cache(cache_dir: str, entries: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Writes the result cache, evicting the least recently used entries above CACHE_MAX_ENTRIES.
+
+    Args:
+    cache_dir (str): Path of the cache directory.
+    entries (Dict[str, Dict[str, Any]]): Cache entries by key.
+    """
+    import json
+
+    if len(entries) > CACHE_MAX_ENTRIES:
+        newest = sorted(entries, key=lambda key: entries[key]["last_used"])
+        entries = {key: entries[key] for key in newest[-CACHE_MAX_ENTRIES:]}
+
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_file = os.path.join(cache_dir, "results.json")
+    with open(cache_file + ".tmp", "w") as file:
+        json.dump(entries, file)
+    os.replace(cache_file + ".tmp", cache_file)
+
+
+def store_cached_result(
+    cache_dir: str, cache_key: str, result: Any, exec_time: float
+) -> None:
+    """
+    Stores a solution result in the cache. Results that don't survive a JSON round trip are skipped.
+
+    Args:
+    cache_dir (str): Path of the cache directory.
+    cache_key (str): Key as returned by result_cache_key.
+    result (Any): The result of the solution function.
+    exec_time (float): The execution time of the solution function.
+    """
+    if not isinstance(result, (int, float, str)):
+        return
+
+    entries = load_result_cache(cache_dir)
+    entries[cache_key] = {
+        "result": result,
+        "exec_time": exec_time,
+        "last_used": time.time(),
+    }
+    save_result_cache(cache_dir, entries)
+
+
+def print_cached_solution(cache: Tuple[str, str], part: int) -> bool:
+    """
+    Prints a cached solution result if there is one and marks it as recently used.
+
+    Args:
+    cache (Tuple[str, str]): Cache directory and key of the solution part.
+    part (int): The part number of the puzzle (1 or 2).
+
+    Returns:
+    bool: True if the result was served from the cache, False otherwise.
+    """
+    entry = lookup_cached_result(cache)
+    if entry is None:
+        return False
+
+    print_solution_result(entry["result"], entry["exec_time"], part, cached=True)
+    return True
+
+
+def lookup_cached_result(cache: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Looks up a cached solution result and marks it as recently used.
+
+    Args:
+    cache (Tuple[str, str]): Cache directory and key of the solution part.
+
+    Returns:
+    Optional[Dict[str, Any]]: The cache entry with 'result' and 'exec_time', or None on a miss.
+    """
+    cache_dir, cache_key = cache
+    entries = load_result_cache(cache_dir)
+    entry = entries.get(cache_key)
+    if entry is None:
+        return None
+
+    entry["last_used"] = time.time()
+    save_result_cache(cache_dir, entries)
+    return entry
+
+
+def benchmark_solution(
+    solution_func: Callable,
+    data: List[str],
+    repeats: int,
+    warmup: int = 0,
+    timeout: Optional[float] = None,
+    max_memory: Optional[int] = None,
+) -> Tuple[Any, List[float], Optional[str]]:
+    """
+    Runs a profiled solution function repeatedly and collects its execution times.
+
+    With a timeout or memory cap every run, warmups included, goes through run_guarded_solution,
+    and the benchmark stops at the first run that is stopped.
+
+    Args:
+    solution_func (Callable): The profiled solution function to benchmark.
+    data (List[str]): Input data for the puzzle.
+    repeats (int): Number of timed runs.
+    warmup (int): Number of untimed runs performed before the timed runs.
+    timeout (Optional[float]): Seconds each run may take, None for no limit.
+    max_memory (Optional[int]): Megabytes of address space each run may use, None for no limit.
+
+    Returns:
+    Tuple[Any, List[float], Optional[str]]: The result of the last run, the execution time of every
+    timed run and None, or 'TIMEOUT'/'OOM' as the last item when a run was stopped.
+    """
+
+    def run_once():
+        if timeout or max_memory:
+            return run_guarded_solution(solution_func, data, timeout, max_memory)
+        return solution_func(data) + (None,)
+
+    for _ in range(warmup):
+        _, _, status = run_once()
+        if status is not None:
+            return None, [], status
+
+    result = None
+    timings = []
+    for _ in range(repeats):
+        result, exec_time, status = run_once()
+        if status is not None:
+            return None, timings, status
+        timings.append(exec_time)
+
+    return result, timings, None
+
+
+def run_guarded_solution(
+    solution_func: Callable,
+    data: Any,
+    timeout: Optional[float] = None,
+    max_memory: Optional[int] = None,
+) -> Tuple[Any, float, Optional[str]]:
+    """
+    Runs a profiled solution function in a child process under a wall-clock timeout and a memory cap.
+
+    The child is killed when the timeout expires. The memory cap limits the child's address
+    space with RLIMIT_AS, which only exists on Unix; elsewhere it is ignored. The child is
+    forked where possible so the input doesn't have to be pickled.
+
+    Args:
+    solution_func (Callable): The profiled solution function.
+    data (Any): Input data for the puzzle.
+    timeout (Optional[float]): Seconds the part may run, None for no limit.
+    max_memory (Optional[int]): Megabytes of address space the child may use, None for no limit.
+
+    Returns:
+    Tuple[Any, float, Optional[str]]: The result, its execution time and None, or
+    (None, elapsed seconds, 'TIMEOUT'/'OOM') when the part was stopped.
+    """
+    import multiprocessing
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+
+    receiver, sender = context.Pipe(duplex=False)
+    child = context.Process(
+        target=guarded_child, args=(sender, solution_func, data, max_memory)
+    )
+    start_time = time.perf_counter()
+    child.start()
+    sender.close()
+
+    try:
+        if not receiver.poll(timeout):
+            child.kill()
+            return None, time.perf_counter() - start_time, "TIMEOUT"
+        status, payload = receiver.recv()
+    except EOFError:
+        # the child died without reporting back, e.g. killed by the kernel for its memory use
+        status, payload = "OOM", None
+    finally:
+        child.join()
+        receiver.close()
+
+    if status == "ok":
+        return payload[0], payload[1], None
+    if status == "OOM":
+        return None, time.perf_counter() - start_time, "OOM"
+    raise RuntimeError(f"Solution failed in the guarded child process:\n{payload}")
+
+
+def guarded_child(
+    sender: Any, solution_func: Callable, data: Any, max_memory: Optional[int]
+) -> None:
+    """
+    Runs a solution function inside the child process of run_guarded_solution.
+
+    Args:
+    sender (Any): Connection the outcome is sent back on.
+    solution_func (Callable): The profiled solution function.
+    data (Any): Input data for the puzzle.
+    max_memory (Optional[int]): Megabytes of address space the child may use, None for no limit.
+    """
+    import traceback
+
+    if max_memory:
+        try:
+            import resource
+
+            limit = max_memory * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError):
+            pass  # no address space limits on this platform
+
+    try:
+        sender.send(("ok", solution_func(data)))
+    except MemoryError:
+        sender.send(("OOM", None))
+    except Exception:
+        sender.send(("error", traceback.format_exc()))
+    finally:
+        sender.close()
+
+
+def print_guard_failure(
+    solution_func: Callable,
+    part: int,
+    status: str,
+    args: argparse.Namespace,
+    expected_answer: Optional[str] = None,
+    is_example: bool = False,
+    source: str = "input",
+) -> None:
+    """
+    Reports a part that was stopped by --timeout or --max-memory.
+
+    Args:
+    solution_func (Callable): The profiled solution function.
+    part (int): The part number of the puzzle (1 or 2).
+    status (str): 'TIMEOUT' or 'OOM'.
+    args (argparse.Namespace): Parsed command line arguments.
+    expected_answer (Optional[str]): The expected answer in example mode.
+    is_example (bool): Flag to indicate if it's an example run.
+    source (str): Label of the data in structured output, e.g. 'input' or 'example 2'.
+    """
+    if output_format != "text":
+        emit_result_record(
+            solution_day(solution_func),
+            source,
+            part,
+            status,
+            expected_answer if is_example else None,
+        )
+        return
+
+    limit = (
+        f"after '{args.timeout:g}' seconds"
+        if status == "TIMEOUT"
+        else f"above '{args.max_memory}' MB"
+    )
+    print_separator()
+    print(f"Solution Part {part}: {red_text(status)} {limit}.")
+    print_separator()
+
+
+def time_parse(parse: Callable, lines: List[str], repeats: int) -> Tuple[Any, float]:
+    """
+    Times a day's parse hook, keeping the fastest of several runs.
+
+    Args:
+    parse (Callable): The raw parse hook.
+    lines (List[str]): The input lines.
+    repeats (int): Number of timed runs.
+
+    Returns:
+    Tuple[Any, float]: The parsed data and the fastest parse time.
+    """
+    timed_parse = profile(parse)
+    data, best_time = None, None
+    for _ in range(repeats):
+        # parse hooks may consume their input, give every run a fresh list
+        data, parse_time = timed_parse(list(lines))
+        best_time = parse_time if best_time is None else min(best_time, parse_time)
+    return data, best_time
+
+
+def summarize_timings(timings: List[float]) -> Dict[str, float]:
+    """
+    Summarizes a list of execution times.
+
+    Args:
+    timings (List[float]): Execution times in seconds.
+
+    Returns:
+    Dict[str, float]: The number of runs along with the min, median, p95 and stddev of the timings.
+    """
+    import math
+    import statistics
+
+    ordered = sorted(timings)
+    p95_index = max(math.ceil(0.95 * len(ordered)) - 1, 0)
+    return {
+        "runs": len(ordered),
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[p95_index],
+        "stddev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+def format_timing_stats(timing_stats: Dict[str, float]) -> str:
+    """
+    Formats benchmark statistics for display.
+
+    Args:
+    timing_stats (Dict[str, float]): Statistics as returned by summarize_timings.
+
+    Returns:
+    str: The formatted statistics.
+    """
+    return (
+        f"Benchmark ({timing_stats['runs']} runs): "
+        f"min '{timing_stats['min']:.6f}' | median '{timing_stats['median']:.6f}' | "
+        f"p95 '{timing_stats['p95']:.6f}' | stddev '{timing_stats['stddev']:.6f}' seconds."
+    )
+
+
+def parse_arguments(
+    add_arguments: Optional[Callable[[argparse.ArgumentParser], None]] = None,
+    check_arguments: Optional[
+        Callable[[argparse.ArgumentParser, argparse.Namespace], None]
+    ] = None,
+) -> argparse.Namespace:
+    """
+    Parses and returns command line arguments for the puzzle solver.
+
+    Args:
+    add_arguments (Optional[Callable[[argparse.ArgumentParser], None]]): Optional function adding a day's own arguments to the parser.
+    check_arguments (Optional[Callable[[argparse.ArgumentParser, argparse.Namespace], None]]): Optional function rejecting combinations of a day's own arguments with parser.error.
+
+    Returns:
+    argparse.Namespace: Parsed command line arguments.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run Advent of Code solutions.")
+    parser.add_argument("--input", default="input.txt", help="Input file path")
+    parser.add_argument("--example", action="store_true", help="Run examples")
+    parser.add_argument("--p1", action="store_true", help="Run only Part 1")
+    parser.add_argument("--p2", action="store_true", help="Run only Part 2")
+    parser.add_argument(
+        "--debug-all", action="store_true", help="Enable all debug messages"
+    )
+    parser.add_argument(
+        "--debug-helper",
+        action="store_true",
+        help="Enable debug messages in helper.py only",
+    )
+    parser.add_argument(
+        "--debug-solution",
+        action="store_true",
+        help="Enable debug messages in solution.py only",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Print one JSON line or CSV row per (example/input, part) instead of the coloured report",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run every (example, part) pair in a process pool; ignored with --bench, --mem, --profile-out and the resource limits",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Number of worker processes for --parallel (default: CPU count)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-run the affected parts when solution.py or the input changes",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SEC",
+        help="Run the parse hook and each part (every run with --bench) in a child process and stop it after SEC seconds (reported as TIMEOUT)",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=int,
+        metavar="MB",
+        help="Run the parse hook and each part (every run with --bench) in a child process limited to MB megabytes of address space (reported as OOM)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always recompute results instead of serving them from the result cache (implied by the debug flags)",
+    )
+    parser.add_argument(
+        "--mem",
+        action="store_true",
+        help="Record peak memory and retained allocations of each part with tracemalloc",
+    )
+    parser.add_argument(
+        "--profile-out",
+        metavar="DIR",
+        help="Profile each part with cProfile and write .pstats and collapsed-stack files to DIR",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Flag parts that are slower than their rolling baseline from the run history; always recomputes, and fills the 'regression' field of --format output",
+    )
+    parser.add_argument(
+        "--compare-threshold",
+        type=float,
+        default=0.1,
+        metavar="FRACTION",
+        help="Allowed slowdown before a part is flagged, as a fraction (default: 0.1)",
+    )
+    parser.add_argument(
+        "--baseline-runs",
+        type=int,
+        default=5,
+        metavar="N",
+        help="Number of earlier runs the rolling baseline is computed from (default: 5)",
+    )
+    parser.add_argument(
+        "--bench",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Benchmark each part over N timed runs and report min/median/p95/stddev",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        metavar="K",
+        help="Number of untimed warmup runs before benchmarking (default: 1)",
+    )
+    # --input-mode only exists for days registering it, see add_input_mode_argument
+    parser.set_defaults(input_mode=None)
+    if add_arguments is not None:
+        add_arguments(parser)
+    args = parser.parse_args()
+    if check_arguments is not None:
+        check_arguments(parser, args)
+    global debug_mode, debug_helper_mode, debug_solution_mode, output_format
+    debug_mode = args.debug_all
+    debug_helper_mode = args.debug_helper or args.debug_all
+    debug_solution_mode = args.debug_solution or args.debug_all
+    output_format = args.format
+    bind_debug_variants()
+    return args
+
+
+def add_input_mode_argument(
+    parser: argparse.ArgumentParser, input_modes: Tuple[str, ...]
+) -> None:
+    """
+    Adds --input-mode for a day whose solutions can read the input in more than one form.
+
+    Meant to be called from the add_arguments hook of parse_arguments.
+
+    Args:
+    parser (argparse.ArgumentParser): The harness argument parser.
+    input_modes (Tuple[str, ...]): The modes of INPUT_MODES the day's solutions accept.
+    """
+    parser.add_argument(
+        "--input-mode",
+        choices=input_modes,
+        help="Override how the input is handed to the solutions, see load_input",
+    )
+
+
+def print_running_mode(args: argparse.Namespace, mode: str = "real input") -> None:
+    """
+    Prints the current running mode of the puzzle solver.
+
+    Args:
+    args (argparse.Namespace): Parsed command line arguments.
+    mode (str): The mode of operation, either 'real input' or 'example'.
+    """
+    if output_format != "text":
+        return
+    if args.p1 and not args.p2:
+        print(yellow_text(f"Running {mode} data against solution_p1."))
+    elif args.p2 and not args.p1:
+        print(yellow_text(f"Running {mode} data against solution_p2."))
+    else:
+        print(
+            yellow_text(f"Running {mode} data against both solution_p1 && solution_p2.")
+        )
+
+
+def determine_and_print_solution_message(
+    no_solution_p1: bool, no_solution_p2: bool
+) -> None:
+    """
+    Determines and prints a message based on whether solution parts returned None.
+
+    Args:
+    no_solution_p1 (bool): Indicates if solution part 1 returned None.
+    no_solution_p2 (bool): Indicates if solution part 2 returned None.
+    """
+    if output_format != "text":
+        return
+    if no_solution_p1 and no_solution_p2:
+        print_no_solution_message("Both solutions")
+    elif no_solution_p1:
+        print_no_solution_message("Solution Part 1:")
+    elif no_solution_p2:
+        print_no_solution_message("Solution Part 2:")
+
+
+def print_no_solution_message(solution_name):
+    if solution_name == "Both solutions":
+        message = "Both solutions seem to be enjoying a coffee break! ☕"
+    else:
+        message = f"{solution_name} seems to be enjoying a coffee break! ☕"
+
+    print_separator()
+    print("\n" + purple_text(message))
+    print(green_text("Need help? Try running: python solution.py --help"))
+
+
+def print_separator() -> None:
+    """
+    Prints a separator line.
+    """
+    print(purple_text("-" * 50))
+
+
+def use_color() -> bool:
+    """
+    Decides on the first coloured print whether output is coloured, and initialises colorama if so.
+
+    Output is plain when stdout isn't a terminal or a structured --format is selected.
+
+    Returns:
+    bool: True if text should be coloured.
+    """
+    global color_enabled
+    if color_enabled is None:
+        color_enabled = output_format == "text" and sys.stdout.isatty()
+        if color_enabled:
+            import colorama
+
+            colorama.init(autoreset=True)
+    return color_enabled
+
+
+def color_text(text: str, color: str) -> str:
+    """
+    Formats the given text with a colorama foreground color, or leaves it plain if colour is off.
+
+    Args:
+    text (str): The text to format.
+    color (str): Name of the colorama.Fore color, e.g. 'GREEN'.
+
+    Returns:
+    str: The formatted text.
+    """
+    if not use_color():
+        return f"{text}"
+
+    from colorama import Fore, Style
+
+    return f"{getattr(Fore, color)}{text}{Style.RESET_ALL}"
+
+
+def green_text(text: str) -> str:
+    """
+    Formats the given text with a green color.
+
+    Args:
+    text (str): The text to format.
+
+    Returns:
+    str: The formatted text.
+    """
+    return color_text(text, "GREEN")
+
+
+def yellow_text(text: str) -> str:
+    """
+    Formats the given text with a yellow color.
+
+    Args:
+    text (str): The text to format.
+
+    Returns:
+    str: The formatted text.
+    """
+    return color_text(text, "YELLOW")
+
+
+def red_text(text: str) -> str:
+    """
+    Formats the given text with a red color.
+
+    Args:
+    text (str): The text to format.
+
+    Returns:
+    str: The formatted text.
+    """
+    return color_text(text, "RED")
+
+
+def purple_text(text: str) -> str:
+    """
+    Formats the given text with a purple color.
+
+    Args:
+    text (str): The text to format.
+
+    Returns:
+    str: The formatted text.
+    """
+    return color_text(text, "MAGENTA")
+
+
+# Example-specific functions
+# An example section of example.txt with its expected answers (Optional[str] each)
+Example = namedtuple("Example", ["data", "answer_a", "answer_b"])
+
+
+def parse_example_data(file_path: str = "example.txt") -> List[Example]:
+    """
+    Parses example data and expected answers from a given file.
+
+    Parsed examples are cached in the cache directory next to the file, keyed on the file's
+    modification time and size, so repeated runs skip parsing. The debug flags bypass the
+    cache, and a cache that can't be written is left alone.
+
+    Args:
+    file_path (str): Path to the file containing the example data.
+
+    Returns:
+    List[Example]: The example sections in file order.
+    """
+    import json
+
+    stat = os.stat(file_path)
+    cache_dir = result_cache_dir(file_path)
+    cache_file = os.path.join(cache_dir, EXAMPLES_FILE_NAME)
+    # the example and answer dumps of --debug-helper only come from actually parsing the file
+    if not (debug_solution_mode or debug_helper_mode):
+        try:
+            with open(cache_file, "r") as file:
+                cached = json.load(file)
+            if cached["mtime"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                return [Example(*example) for example in cached["examples"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    with open(file_path, "r") as file:
+        examples = parse_example_lines(file)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file + ".tmp", "w") as file:
+            json.dump(
+                {"mtime": stat.st_mtime_ns, "size": stat.st_size, "examples": examples},
+                file,
+            )
+        os.replace(cache_file + ".tmp", cache_file)
+    except OSError:
+        # e.g. a read-only checkout, the next run parses the file again
+        pass
+    return examples
+
+
+def parse_example_lines(lines: Iterator[str]) -> List[Example]:
+    """
+    Parses example sections in a single pass over the lines of an example file.
+
+    A section starts at a line containing 'Example data' and runs up to its 'answer_a:'
+    line, which may be followed by an 'answer_b:' line. Separator lines are skipped.
+
+    Args:
+    lines (Iterator[str]): Lines of the example file.
+
+    Returns:
+    List[Example]: The example sections in file order.
+    """
+    examples = []
+    data_lines = None  # lines of the section being read, None between sections
+    answer_a = None
+
+    def close_section(answer_b: Optional[str] = None) -> None:
+        example = Example("\n".join(data_lines).strip(), answer_a, answer_b)
+        if debug_helper_mode:
+            print(f"{green_text('Example data:')} \n{example.data}")
+            print(
+                f"\n{green_text('Extracted answers:')} \np1: {example.answer_a}, p2: {example.answer_b}\n"
+            )
+        examples.append(example)
+
+    for line in lines:
+        line = line.rstrip("\n")
+        if answer_a is not None:
+            # the line right after answer_a: holds answer_b: if there is one
+            has_answer_b = line.startswith("answer_b:")
+            close_section(line.partition(": ")[2] if has_answer_b else None)
+            data_lines = answer_a = None
+            if has_answer_b:
+                continue
+        if "Example data" in line:
+            if data_lines is not None:
+                close_section()
+            data_lines = []
+        elif data_lines is None or line == EXAMPLE_SEPARATOR:
+            continue
+        elif line.startswith("answer_a:"):
+            answer_a = line.partition(": ")[2]
+        else:
+            data_lines.append(line)
+
+    if data_lines is not None:
+        close_section()
+
+    return examples
+
+
+def run_example_solutions(
+    solution_p1: Callable,
+    solution_p2: Callable,
+    args: argparse.Namespace,
+    parse: Optional[Callable] = None,
+    input_mode: str = "lines",
+) -> None:
+    """
+    Runs the provided solution functions against example data.
+
+    Args:
+    solution_p1 (Callable): Function for solution part 1.
+    solution_p2 (Callable): Function for solution part 2.
+    args (argparse.Namespace): Parsed command line arguments.
+    parse (Optional[Callable]): Optional function that parses each example once for both parts.
+    input_mode (str): How the solutions consume the input, see load_input. Overridden by --input-mode, where the day offers it.
+    """
+    verify_input_file(is_example=True)
+    print_running_mode(args, mode="example")
+    examples = parse_example_data()
+
+    execute_examples(solution_p1, solution_p2, examples, args, parse, input_mode)
+
+    if args.watch:
+        watch_solutions(
+            solution_p1, solution_p2, args, parse, input_mode, examples=examples
+        )
+
+
+def execute_examples(
+    solution_p1: Callable,
+    solution_p2: Callable,
+    examples: List[Example],
+    args: argparse.Namespace,
+    parse: Optional[Callable] = None,
+    input_mode: str = "lines",
+) -> None:
+    """
+    Runs the provided solution functions against already parsed example sections.
+
+    Args:
+    solution_p1 (Callable): Function for solution part 1.
+    solution_p2 (Callable): Function for solution part 2.
+    examples (List[Example]): Sections as returned by parse_example_data.
+    args (argparse.Namespace): Parsed command line arguments.
+    parse (Optional[Callable]): Optional function that parses each example once for both parts.
+    input_mode (str): How the solutions consume the input, see load_input. Overridden by --input-mode, where the day offers it.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    overall_no_solution_p1 = False
+    overall_no_solution_p2 = False
+
+    executor = None
+    all_futures = [None] * len(examples)
+    if (
+        args.parallel
+        and args.bench == 0
+        and not args.mem
+        and not args.profile_out
+        and not (args.timeout or args.max_memory)
+    ):
+        executor = ProcessPoolExecutor(max_workers=args.jobs or os.cpu_count())
+        all_futures = submit_example_parts(
+            executor, solution_p1, solution_p2, examples, args, parse, input_mode
+        )
+
+    try:
+        for i, (example_data, answer_a, answer_b) in enumerate(examples, start=1):
+            if output_format == "text":
+                print_separator()
+                print(f"{green_text(f'Using example data {i}')}:")
+
+            # Wait for this example only, so earlier results print before a later one fails
+            outcomes = None
+            data = None
+            if all_futures[i - 1] is not None:
+                outcomes = {
+                    part: future.result() for part, future in all_futures[i - 1].items()
+                }
+            else:
+                data = load_input(
+                    example_data, args.input_mode or input_mode, is_file=False
+                )
+
+            no_solution_p1, no_solution_p2 = execute_solutions(
+                solution_p1,
+                solution_p2,
+                data,
+                args,
+                answer_a,
+                answer_b,
+                is_example=True,
+                parse=parse,
+                source=f"example {i}",
+                outcomes=outcomes,
+            )
+
+            overall_no_solution_p1 |= no_solution_p1
+            overall_no_solution_p2 |= no_solution_p2
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    determine_and_print_solution_message(overall_no_solution_p1, overall_no_solution_p2)
+
+
+# The outcome of a part run by a worker process, with the output it printed
+PartOutcome = namedtuple(
+    "PartOutcome", ["result", "exec_time", "parse_time", "parse_output", "output"]
+)
+
+
+def submit_example_parts(
+    executor: ProcessPoolExecutor,
+    solution_p1: Callable,
+    solution_p2: Callable,
+    examples: List[Example],
+    args: argparse.Namespace,
+    parse: Optional[Callable] = None,
+    input_mode: str = "lines",
+) -> List[Dict[int, Future]]:
+    """
+    Submits every selected (example, part) pair to a process pool.
+
+    Args:
+    executor (ProcessPoolExecutor): The process pool.
+    solution_p1 (Callable): Function for solution part 1.
+    solution_p2 (Callable): Function for solution part 2.
+    examples (List[Example]): Sections as returned by parse_example_data.
+    args (argparse.Namespace): Parsed command line arguments.
+    parse (Optional[Callable]): Optional function that parses each example once for both parts.
+    input_mode (str): How the solutions consume the input, see load_input. Overridden by --input-mode, where the day offers it.
+
+    Returns:
+    List[Dict[int, Future]]: Per example, the futures of its PartOutcome by part.
+    """
+    parts = []
+    if args.p1 or not (args.p1 or args.p2):
+        parts.append((1, solution_p1))
+    if args.p2 or not (args.p1 or args.p2):
+        parts.append((2, solution_p2))
+
+    return [
+        {
+            part: executor.submit(
+                run_example_part,
+                solution_func,
+                example.data,
+                parse,
+                args.input_mode or input_mode,
+            )
+            for part, solution_func in parts
+        }
+        for example in examples
+    ]
+
+
+def run_example_part(
+    solution_func: Callable,
+    example_data: str,
+    parse: Optional[Callable] = None,
+    input_mode: str = "lines",
+) -> PartOutcome:
+    """
+    Runs a single part against an example section. Safe to call from a worker process.
+
+    Output printed by the parse hook and the solution is captured so the parent can print it
+    in the original order.
+
+    Args:
+    solution_func (Callable): The profiled solution function.
+    example_data (str): The example data.
+    parse (Optional[Callable]): Optional function that parses the example first.
+    input_mode (str): How the solution consumes the input, see load_input.
+
+    Returns:
+    PartOutcome: The result, execution and parse times and the captured output.
+    """
+    from contextlib import redirect_stdout
+
+    data = load_input(example_data, input_mode, is_file=False)
+    parse_time = None
+    parse_output = io.StringIO()
+    if parse is not None:
+        with redirect_stdout(parse_output):
+            data, parse_time = profile(parse)(data)
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result, exec_time = solution_func(data)
+    return PartOutcome(
+        result, exec_time, parse_time, parse_output.getvalue(), output.getvalue()
+    )
+
+
+def print_example_result(
+    result: Optional[str],
+    expected_answer: str,
+    exec_time: float,
+    part: int,
+    timing_stats: Optional[Dict[str, float]] = None,
+    mem_stats: Optional[Dict[str, int]] = None,
+) -> None:
+    """
+    Prints the result of an example solution, comparing it with the expected answer and displaying the execution time.
+
+    Args:
+    result (Optional[str]): The result obtained from the solution function.
+    expected_answer (str): The expected answer for the example.
+    exec_time (float): The execution time of the solution function.
+    part (int): The part number of the puzzle (1 or 2).
+    timing_stats (Optional[Dict[str, float]]): Benchmark statistics, if benchmarking was enabled.
+    mem_stats (Optional[Dict[str, int]]): Memory statistics, if memory tracing was enabled.
+
+    """
+    if result is None:
+        print(f"Solution Part {part} returns {red_text('None')}")
+    else:
+        result_text = (
+            green_text(result) if str(result) == expected_answer else red_text(result)
+        )
+        print(
+            f"Example Part {part}: Expected Result: '{expected_answer}' | Actual Result: '{result_text}' -> Execution Time: '{exec_time:.6f}' seconds."
+        )
+        if timing_stats:
+            print(format_timing_stats(timing_stats))
+        if mem_stats:
+            print(format_memory_stats(mem_stats))
+        print_separator()
+
+
+# Real-input specific functions
+def run_solutions(
+    file_path: str,
+    solution_p1: Callable,
+    solution_p2: Callable,
+    args: argparse.Namespace,
+    parse: Optional[Callable] = None,
+    input_mode: str = "lines",
+) -> None:
+    """
+    Runs the provided solution functions against real input data.
+
+    Args:
+    file_path (str): Path to the file containing the real input data.
+    solution_p1 (Callable): Function for solution part 1.
+    solution_p2 (Callable): Function for solution part 2.
+    args (argparse.Namespace): Parsed command line arguments.
+    parse (Optional[Callable]): Optional function that parses the input once for both parts.
+    input_mode (str): How the solutions consume the input, see load_input. Overridden by --input-mode, where the day offers it.
+    """
+    verify_input_file(is_example=False)
+    print_running_mode(args)
+    data = load_input(file_path, args.input_mode or input_mode)
+
+    no_solution_p1, no_solution_p2 = execute_solutions(
+        solution_p1, solution_p2, data, args, parse=parse, input_file=file_path
+    )
+
+    determine_and_print_solution_message(no_solution_p1, no_solution_p2)
+
+    if args.watch:
+        watch_solutions(
+            solution_p1, solution_p2, args, parse, input_mode, file_path=file_path
+        )
+
+
+def print_solution_result(
+    result: Optional[str],
+    exec_time: float,
+    part: int,
+    timing_stats: Optional[Dict[str, float]] = None,
+    cached: bool = False,
+    mem_stats: Optional[Dict[str, int]] = None,
+) -> None:
+    """
+    Prints the result of a solution along with its execution time.
+
+    Args:
+    result (Optional[str]): The result of the solution function.
+    exec_time (float): The execution time of the solution.
+    part (int): The part number of the puzzle (1 or 2).
+    timing_stats (Optional[Dict[str, float]]): Benchmark statistics, if benchmarking was enabled.
+    cached (bool): Flag to indicate the result was served from the result cache.
+    mem_stats (Optional[Dict[str, int]]): Memory statistics, if memory tracing was enabled.
+    """
+    if result is None:
+        print_separator()
+        print(f"Solution Part {part}: returns {red_text('None')}.")
+    else:
+        print_separator()
+        print(
+            f"Solution Part {part}: '{green_text(result)}' -> Execution Time: '{green_text(f'{exec_time:.6f}')}' seconds."
+            + (f" {yellow_text('(cached)')}" if cached else "")
+        )
+        if timing_stats:
+            print(format_timing_stats(timing_stats))
+        if mem_stats:
+            print(format_memory_stats(mem_stats))
+        print_separator()
+
+
+# Watch mode
+def watch_solutions(
+    solution_p1: Callable,
+    solution_p2: Callable,
+    args: argparse.Namespace,
+    parse: Optional[Callable] = None,
+    input_mode: str = "lines",
+    file_path: Optional[str] = None,
+    examples: Optional[List[Example]] = None,
+) -> None:
+    """
+    Polls the solution module and its input and re-runs the affected parts on every change.
+
+    An edited solution.py is reloaded in place and only the parts whose source hash (see
+    part_source_hash) changed are re-run; a changed input re-runs every selected part.
+    Parsed example sections are kept between runs and only re-read when example.txt changes.
+    Runs until interrupted with Ctrl+C.
+
+    Args:
+    solution_p1 (Callable): Function for solution part 1.
+    solution_p2 (Callable): Function for solution part 2.
+    args (argparse.Namespace): Parsed command line arguments.
+    parse (Optional[Callable]): Optional function that parses the input once for both parts.
+    input_mode (str): How the solutions consume the input, see load_input. Overridden by --input-mode, where the day offers it.
+    file_path (Optional[str]): Path to the real input file, None when watching the examples.
+    examples (Optional[List[Example]]): Already parsed example sections.
+    """
+    import argparse
+    import inspect
+
+    module_path = inspect.getsourcefile(inspect.unwrap(solution_p1))
+    input_path = file_path or "example.txt"
+    selected = {1: args.p1 or not args.p2, 2: args.p2 or not args.p1}
+    funcs = (solution_p1, solution_p2)
+    hashes = [part_source_hash(func, funcs) for func in funcs]
+    mtimes = {path: watched_mtime(path) for path in (module_path, input_path)}
+
+    # status lines stay off stdout under --format json/csv, which carries only records
+    with solver_output():
+        print(yellow_text(f"Watching {module_path} and {input_path}, Ctrl+C to stop."))
+    try:
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            changed = {path for path in mtimes if watched_mtime(path) != mtimes[path]}
+            if not changed:
+                continue
+            for path in changed:
+                mtimes[path] = watched_mtime(path)
+
+            parts = set()
+            try:
+                if module_path in changed:
+                    module = load_watched_module(module_path)
+                    funcs = (module.solution_p1, module.solution_p2)
+                    parse = getattr(module, "parse", None)
+                    new_hashes = [part_source_hash(func, funcs) for func in funcs]
+                    parts |= {
+                        part
+                        for part, (old, new) in enumerate(zip(hashes, new_hashes), 1)
+                        if old != new
+                    }
+                    hashes = new_hashes
+                if input_path in changed:
+                    parts |= {1, 2}
+                    if file_path is None:
+                        examples = parse_example_data()
+                parts = {part for part in parts if selected[part]}
+                if not parts:
+                    continue
+
+                run_args = argparse.Namespace(
+                    **{**vars(args), "p1": 1 in parts, "p2": 2 in parts}
+                )
+                with solver_output():
+                    print_separator()
+                    print(
+                        yellow_text(
+                            f"Change detected, re-running part(s) {sorted(parts)}."
+                        )
+                    )
+                if file_path is None:
+                    execute_examples(*funcs, examples, run_args, parse, input_mode)
+                else:
+                    data = load_input(file_path, args.input_mode or input_mode)
+                    no_solution_p1, no_solution_p2 = execute_solutions(
+                        *funcs, data, run_args, parse=parse, input_file=file_path
+                    )
+                    determine_and_print_solution_message(no_solution_p1, no_solution_p2)
+            except Exception as e:
+                with solver_output():
+                    print(red_text(f"{type(e).__name__}: {e}"))
+    except KeyboardInterrupt:
+        with solver_output():
+            print()
+
+
+def watched_mtime(path: str) -> Optional[int]:
+    """
+    Returns the modification time of a watched file.
+
+    Args:
+    path (str): Path of the file.
+
+    Returns:
+    Optional[int]: The modification time in nanoseconds, or None while the file is missing.
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_watched_module(module_path: str) -> Any:
+    """
+    Imports a fresh copy of a solution module without running its __main__ block.
+
+    Args:
+    module_path (str): Path of the solution module.
+
+    Returns:
+    Any: The loaded module.
+    """
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("aoc_watched_solution", module_path)
+    module = importlib.util.module_from_spec(spec)
+    # inspect resolves the module of the reloaded functions through sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,382 @@
+import os
+import io
+import sys
+import time
+import argparse
+import importlib.util
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+from aoc_harness import helper
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def discover_days(year: str, selected_days: Optional[List[int]] = None) -> List[str]:
+    """
+    Finds every day directory of a year that contains a solution.py.
+
+    Args:
+    year (str): The year directory to search, e.g. '2023'.
+    selected_days (Optional[List[int]]): Day numbers to keep, or None for all days.
+
+    Returns:
+    List[str]: Sorted absolute paths of the day directories.
+    """
+    year_dir = os.path.join(REPO_ROOT, year)
+    day_dirs = []
+    for name in sorted(os.listdir(year_dir)):
+        day_dir = os.path.join(year_dir, name)
+        if not name.startswith("day_") or not os.path.isfile(
+            os.path.join(day_dir, "solution.py")
+        ):
+            continue
+        if selected_days and day_number(name) not in selected_days:
+            continue
+        day_dirs.append(day_dir)
+    return day_dirs
+
+
+def day_number(day_name: str) -> int:
+    """
+    Extracts the day number from a day directory name such as 'day_10_inc'.
+
+    Args:
+    day_name (str): The day directory name.
+
+    Returns:
+    int: The day number.
+    """
+    return int(day_name.split("_")[1])
+
+
+def load_solution(day_dir: str, file_name: str = "solution.py") -> ModuleType:
+    """
+    Imports a day's solution module under a unique module name.
+
+    Output printed while the module is imported is discarded so it doesn't break the report.
+
+    Args:
+    day_dir (str): Path to the day directory.
+    file_name (str): The solution file inside the day directory, e.g. 'solution_clean.py'.
+
+    Returns:
+    ModuleType: The loaded solution module.
+    """
+    # Day solutions 'import helper'; point them at the shared harness module
+    sys.modules.setdefault("helper", helper)
+    module_name = (
+        f"aoc_{os.path.basename(os.path.dirname(day_dir))}_{os.path.basename(day_dir)}"
+    )
+    if file_name != "solution.py":
+        variant = os.path.splitext(file_name)[0].replace(" ", "_")
+        module_name = f"{module_name}_{variant}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(
+        module_name, os.path.join(day_dir, file_name)
+    )
+    module = importlib.util.module_from_spec(spec)
+    with redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    sys.modules[module_name] = module
+    return module
+
+
+def prepare_day(day_dir: str, input_name: Optional[str] = None) -> Optional[str]:
+    """
+    Checks that a day can be run and imports its solution module.
+
+    Args:
+    day_dir (str): Path to the day directory.
+    input_name (Optional[str]): Name of the input file inside the day directory, None to skip the check.
+
+    Returns:
+    Optional[str]: A status message explaining why the day is skipped, or None if it can run.
+    """
+    if input_name is not None and not os.path.exists(os.path.join(day_dir, input_name)):
+        return f"no {input_name}"
+
+    try:
+        module = load_solution(day_dir)
+    except Exception as e:
+        return f"import failed ({type(e).__name__}: {e})"
+
+    if not all(hasattr(module, name) for name in ("solution_p1", "solution_p2")):
+        return "no solution_p1/solution_p2"
+
+    return None
+
+
+def set_output_format(output_format: str) -> None:
+    """
+    Selects the output format in a worker process.
+
+    Args:
+    output_format (str): One of helper.OUTPUT_FORMATS.
+    """
+    helper.output_format = output_format
+
+
+def load_day_input(day_dir: str, input_name: str) -> Tuple[Any, float]:
+    """
+    Reads a day's input and runs its optional parse hook.
+
+    Args:
+    day_dir (str): Path to the day directory.
+    input_name (str): Name of the input file inside the day directory.
+
+    Returns:
+    Tuple[Any, float]: The data handed to the solution parts and the parse time (0.0 without a parse hook).
+    """
+    module = load_solution(day_dir)
+    data = helper.read_input(os.path.join(day_dir, input_name))
+
+    parse = getattr(module, "parse", None)
+    if parse is None:
+        return data, 0.0
+    with helper.solver_output():
+        return helper.profile(parse)(data)
+
+
+def run_part(
+    day_dir: str, input_name: str, part: int, data: Any = None
+) -> Tuple[Any, float, float]:
+    """
+    Runs a single part of a day. Safe to call from a worker process.
+
+    Args:
+    day_dir (str): Path to the day directory.
+    input_name (str): Name of the input file inside the day directory.
+    part (int): The part number of the puzzle (1 or 2).
+    data (Any): Already loaded (and parsed) input data, loaded from the input file if None.
+
+    Returns:
+    Tuple[Any, float, float]: The result of the part, its execution time and the time spent parsing for this call.
+    A failing parse hook or part reports 'error: <ExceptionType>' as the result.
+    """
+    module = load_solution(day_dir)
+    parse_time = 0.0
+    if data is None:
+        try:
+            data, parse_time = load_day_input(day_dir, input_name)
+        except Exception as e:
+            return f"error: {type(e).__name__}", 0.0, 0.0
+
+    solution_func = getattr(module, f"solution_p{part}")
+    try:
+        with helper.solver_output():
+            result, exec_time = solution_func(data)
+    except Exception as e:
+        result, exec_time = f"error: {type(e).__name__}", 0.0
+    return result, exec_time, parse_time
+
+
+def run_day(day_dir: str, input_name: str) -> Dict[str, Any]:
+    """
+    Runs both parts of a day against its input file, parsing the input only once.
+
+    Args:
+    day_dir (str): Path to the day directory.
+    input_name (str): Name of the input file inside the day directory.
+
+    Returns:
+    Dict[str, Any]: The day name, an optional status message, the parse time and a (result, exec_time) pair per part.
+    """
+    report = {
+        "day": os.path.basename(day_dir),
+        "status": prepare_day(day_dir, input_name),
+        "parse_time": 0.0,
+        "parts": {},
+    }
+    if report["status"]:
+        return report
+
+    try:
+        data, report["parse_time"] = load_day_input(day_dir, input_name)
+    except Exception as e:
+        # like a failing part, so the rest of the year still runs
+        for part in (1, 2):
+            report["parts"][part] = (f"error: {type(e).__name__}", 0.0)
+        return report
+
+    for part in (1, 2):
+        result, exec_time, _ = run_part(day_dir, input_name, part, data)
+        report["parts"][part] = (result, exec_time)
+
+    return report
+
+
+def run_days_parallel(
+    day_dirs: List[str], input_name: str, jobs: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Runs every (day, part) pair in a process pool and gathers the results in day order.
+
+    Args:
+    day_dirs (List[str]): Paths to the day directories.
+    input_name (str): Name of the input file inside each day directory.
+    jobs (Optional[int]): Number of worker processes, defaults to the number of CPU cores.
+
+    Returns:
+    List[Dict[str, Any]]: Day reports in the same shape as run_day.
+    """
+    reports = [
+        {
+            "day": os.path.basename(day_dir),
+            "status": prepare_day(day_dir, input_name),
+            "parse_time": 0.0,
+            "parts": {},
+        }
+        for day_dir in day_dirs
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs or os.cpu_count(),
+        initializer=set_output_format,
+        initargs=(helper.output_format,),
+    ) as executor:
+        futures = [
+            (report, part, executor.submit(run_part, day_dir, input_name, part))
+            for day_dir, report in zip(day_dirs, reports)
+            if not report["status"]
+            for part in (1, 2)
+        ]
+        for report, part, future in futures:
+            result, exec_time, parse_time = future.result()
+            report["parts"][part] = (result, exec_time)
+            # both workers parse on their own; report the part 1 measurement
+            if part == 1:
+                report["parse_time"] = parse_time
+
+    return reports
+
+
+def print_report(reports: List[Dict[str, Any]], wall_time: float) -> None:
+    """
+    Prints the combined timing table for all days.
+
+    Args:
+    reports (List[Dict[str, Any]]): Day reports as returned by run_day.
+    wall_time (float): Total wall-clock time of the run in seconds.
+    """
+    total_time = 0.0
+
+    helper.print_separator()
+    print(
+        f"{'Day':<12} {'Parse (s)':>10} {'Part 1':>16} {'Time (s)':>10} {'Part 2':>16} {'Time (s)':>10}"
+    )
+    helper.print_separator()
+
+    for report in reports:
+        if report["status"]:
+            print(f"{report['day']:<12} {helper.yellow_text(report['status'])}")
+            continue
+
+        total_time += report["parse_time"]
+        columns = [f"{report['parse_time']:>10.6f}"]
+        for part in (1, 2):
+            result, exec_time = report["parts"][part]
+            total_time += exec_time
+            result_text = f"{str(result):>16}"
+            result_text = (
+                helper.red_text(result_text)
+                if result is None or str(result).startswith("error")
+                else helper.green_text(result_text)
+            )
+            columns.append(f"{result_text} {exec_time:>10.6f}")
+        print(f"{report['day']:<12} {' '.join(columns)}")
+
+    helper.print_separator()
+    print(
+        f"Total solve time: '{helper.green_text(f'{total_time:.6f}')}' seconds | Wall time: '{helper.green_text(f'{wall_time:.6f}')}' seconds."
+    )
+    helper.print_separator()
+
+
+def emit_report_records(reports: List[Dict[str, Any]]) -> None:
+    """
+    Prints one structured record per (day, part) in the selected --format instead of the table.
+
+    Skipped days are left out; their status only appears in the text report.
+
+    Args:
+    reports (List[Dict[str, Any]]): Day reports as returned by run_day.
+    """
+    for report in reports:
+        if report["status"]:
+            continue
+        for part in (1, 2):
+            result, exec_time = report["parts"][part]
+            helper.emit_result_record(
+                report["day"],
+                "input",
+                part,
+                result,
+                exec_time=exec_time,
+                parse_time=report["parse_time"] if part == 1 else None,
+            )
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses and returns command line arguments for the multi-day runner.
+
+    Returns:
+    argparse.Namespace: Parsed command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run every day's solutions in a single process."
+    )
+    parser.add_argument("--year", default="2023", help="Year directory to run")
+    parser.add_argument(
+        "--day",
+        type=int,
+        nargs="+",
+        metavar="N",
+        help="Only run the given day numbers",
+    )
+    parser.add_argument(
+        "--input", default="input.txt", help="Input file name inside each day"
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run every (day, part) pair in a process pool",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Number of worker processes for --parallel (default: CPU count)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=helper.OUTPUT_FORMATS,
+        default="text",
+        help="Print one JSON line or CSV row per (day, part) instead of the table",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_arguments()
+    helper.output_format = args.format
+    start_time = time.perf_counter()
+    day_dirs = discover_days(args.year, args.day)
+    if args.parallel:
+        reports = run_days_parallel(day_dirs, args.input, args.jobs)
+    else:
+        reports = [run_day(day_dir, args.input) for day_dir in day_dirs]
+    wall_time = time.perf_counter() - start_time
+    if args.format != "text":
+        emit_report_records(reports)
+    else:
+        print_report(reports, wall_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+import os
+import sys
+import csv
+import math
+import argparse
+from typing import Any, Dict, List, Optional, Tuple
+
+from aoc_harness import helper
+from aoc_harness.generators import available_days, generate_input, load_generator
+from aoc_harness.runner import day_number, discover_days, load_solution, prepare_day
+
+
+def time_part(
+    solution_func: Any, data: Any, repeats: int, timeout: float
+) -> Tuple[Any, Optional[float]]:
+    """
+    Times a solution part, keeping the fastest of several runs.
+
+    Args:
+    solution_func (Any): The profiled solution function.
+    data (Any): The (parsed) input data.
+    repeats (int): Number of timed runs.
+    timeout (float): Seconds a single run may take.
+
+    Returns:
+    Tuple[Any, Optional[float]]: The result and the fastest execution time, or
+    ('TIMEOUT'/'OOM', None) when a run was stopped.
+    """
+    result, best_time = None, None
+    for _ in range(repeats):
+        result, exec_time, status = helper.run_guarded_solution(
+            solution_func, data, timeout
+        )
+        if status is not None:
+            return status, None
+        best_time = exec_time if best_time is None else min(best_time, exec_time)
+    return result, best_time
+
+
+def fit_exponent(sizes: List[int], timings: List[float]) -> float:
+    """
+    Fits run time ~ size ** k by least squares on the log-log points.
+
+    Args:
+    sizes (List[int]): Input sizes.
+    timings (List[float]): Execution times measured at those sizes.
+
+    Returns:
+    float: The fitted exponent k.
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(timing, 1e-9)) for timing in timings]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    return covariance / variance
+
+
+def scale_day(day_dir: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Runs both parts of a day on generated inputs of geometrically increasing size.
+
+    Sizes start at the generator's BENCH_SIZE and grow by args.factor for args.steps steps.
+    A part stops growing once a run is stopped by the timeout. Days with a parse hook do their
+    parsing work there, so its time is added to the time of every part.
+
+    Args:
+    day_dir (str): Path to the day directory.
+    args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+    Dict[str, Any]: The day name, an optional status message, and per part the declared
+    exponent with the (size, seconds) points, the result of the last run and the size a
+    stopped run had ('stopped_at').
+    """
+    report = {"day": os.path.basename(day_dir), "status": None, "parts": {}}
+    day = day_number(report["day"])
+    if day not in available_days():
+        report["status"] = "no generator"
+        return report
+
+    report["status"] = prepare_day(day_dir)
+    if report["status"]:
+        return report
+
+    module = load_solution(day_dir)
+    generator = load_generator(day)
+    parse = getattr(module, "parse", None)
+    parts = [part for part in (1, 2) if part in args.parts]
+    for part in parts:
+        report["parts"][part] = {
+            "declared": generator.COMPLEXITY[part],
+            "points": [],
+            "result": None,
+        }
+
+    for step in range(args.steps):
+        size = generator.BENCH_SIZE * args.factor**step
+        data = helper.read_input(generate_input(day, size, args.seed), is_file=False)
+        parse_time = 0.0
+        if parse is not None:
+            data, parse_time = helper.time_parse(parse, data, args.repeats)
+
+        for part in parts:
+            part_report = report["parts"][part]
+            if part_report["result"] in ("TIMEOUT", "OOM"):
+                continue
+            solution_func = getattr(module, f"solution_p{part}")
+            result, exec_time = time_part(
+                solution_func, data, args.repeats, args.timeout
+            )
+            part_report["result"] = result
+            if exec_time is None:
+                part_report["stopped_at"] = size
+            else:
+                part_report["points"].append((size, parse_time + exec_time))
+
+    return report
+
+
+def check_part(part_report: Dict[str, Any], tolerance: float) -> Tuple[str, bool]:
+    """
+    Compares the fitted exponent of a part with its declared complexity.
+
+    Args:
+    part_report (Dict[str, Any]): A part entry of a scale_day report.
+    tolerance (float): How far the fitted exponent may exceed the declared one.
+
+    Returns:
+    Tuple[str, bool]: A status message and whether the part passed.
+    """
+    result = part_report["result"]
+    if result in ("TIMEOUT", "OOM"):
+        return f"{result} at size {part_report['stopped_at']}", False
+    if result is None:
+        return "no result", True
+    if len(part_report["points"]) < 2:
+        return "not enough sizes", True
+
+    sizes, timings = zip(*part_report["points"])
+    part_report["fitted"] = fit_exponent(list(sizes), list(timings))
+    if part_report["fitted"] > part_report["declared"] + tolerance:
+        return "exceeds declared complexity", False
+    return "ok", True
+
+
+def print_scaling_report(reports: List[Dict[str, Any]], tolerance: float) -> bool:
+    """
+    Prints the fitted and declared exponent of every part, with its run time per size.
+
+    Args:
+    reports (List[Dict[str, Any]]): Day reports as returned by scale_day.
+    tolerance (float): How far the fitted exponent may exceed the declared one.
+
+    Returns:
+    bool: True if every part stayed within its declared complexity.
+    """
+    passed = True
+
+    helper.print_separator()
+    print(f"{'Day':<12} {'Part':>4} {'Declared':>8} {'Fitted':>8}  Status")
+    helper.print_separator()
+
+    for report in reports:
+        if report["status"]:
+            print(f"{report['day']:<12} {helper.yellow_text(report['status'])}")
+            continue
+
+        for part, part_report in report["parts"].items():
+            status, part_passed = check_part(part_report, tolerance)
+            passed &= part_passed
+            fitted = part_report.get("fitted")
+            fitted_text = f"{fitted:>8.2f}" if fitted is not None else f"{'-':>8}"
+            status_text = (
+                helper.green_text(status) if part_passed else helper.red_text(status)
+            )
+            print(
+                f"{report['day']:<12} {part:>4} {part_report['declared']:>8.2f} {fitted_text}  {status_text}"
+            )
+            points = ", ".join(
+                f"{size}: {exec_time:.6f}s" for size, exec_time in part_report["points"]
+            )
+            if points and part_report["result"] is not None:
+                print(f"{'':<12} {points}")
+
+    helper.print_separator()
+    if passed:
+        print(helper.green_text("Every part scales within its declared complexity."))
+    else:
+        print(helper.red_text("Some parts scale worse than their declared complexity."))
+    helper.print_separator()
+    return passed
+
+
+def write_points(reports: List[Dict[str, Any]], file_path: str) -> None:
+    """
+    Writes every measured (size, seconds) point as CSV, ready to plot run time against size.
+
+    Args:
+    reports (List[Dict[str, Any]]): Day reports as returned by scale_day.
+    file_path (str): Path of the CSV file to write.
+    """
+    with open(file_path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["day", "part", "size", "seconds"])
+        for report in reports:
+            for part, part_report in report["parts"].items():
+                for size, exec_time in part_report["points"]:
+                    writer.writerow([report["day"], part, size, exec_time])
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses and returns command line arguments for the scaling benchmark.
+
+    Returns:
+    argparse.Namespace: Parsed command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark every day on generated inputs of growing size and check how it scales."
+    )
+    parser.add_argument("--year", default="2023", help="Year directory to run")
+    parser.add_argument(
+        "--day",
+        type=int,
+        nargs="+",
+        metavar="N",
+        help="Only run the given day numbers",
+    )
+    parser.add_argument(
+        "--parts",
+        type=int,
+        nargs="+",
+        choices=(1, 2),
+        default=[1, 2],
+        help="Parts to benchmark (default: both)",
+    )
+    parser.add_argument(
+        "--steps",
+        type=int,
+        default=5,
+        metavar="N",
+        help="Number of sizes per day (default: 5)",
+    )
+    parser.add_argument(
+        "--factor",
+        type=int,
+        default=2,
+        metavar="F",
+        help="Growth factor between consecutive sizes (default: 2)",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Timed runs per size, the fastest is kept (default: 3)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.3,
+        help="How far a fitted exponent may exceed the declared one (default: 0.3)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60.0,
+        metavar="SEC",
+        help="Seconds a single run may take before the part fails (default: 60)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="Write every (day, part, size, seconds) point to a CSV file for plotting",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_arguments()
+    reports = [
+        scale_day(day_dir, args) for day_dir in discover_days(args.year, args.day)
+    ]
+    if args.output:
+        write_points(reports, args.output)
+    if not print_scaling_report(reports, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import os
+import sys
+import argparse
+import subprocess
+import tempfile
+from typing import Dict, List, Tuple
+
+from aoc_harness import helper
+from aoc_harness.runner import discover_days
+
+
+def measure_import_time(day_dir: str) -> Tuple[int, List[Tuple[str, int]]]:
+    """
+    Imports a day's solution in a fresh interpreter under -X importtime.
+
+    This covers the harness helper and everything the solution module does at import time. An
+    untimed import runs first, with bytecode writing allowed, so the measured one loads cached
+    bytecode like any later run instead of compiling the sources. The bytecode goes to a
+    temporary PYTHONPYCACHEPREFIX, so no __pycache__ directories are left in the tree.
+
+    Args:
+    day_dir (str): Path to the day directory.
+
+    Returns:
+    Tuple[int, List[Tuple[str, int]]]: The cumulative import time of 'solution' in microseconds,
+    and the self time of every module it pulled in, slowest first.
+    """
+    with tempfile.TemporaryDirectory() as pycache_prefix:
+        env = {
+            name: value
+            for name, value in os.environ.items()
+            if name != "PYTHONDONTWRITEBYTECODE"
+        }
+        env["PYTHONPYCACHEPREFIX"] = pycache_prefix
+        subprocess.run(
+            [sys.executable, "-c", "import solution"],
+            cwd=day_dir,
+            env=env,
+            capture_output=True,
+            check=True,
+        )
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import solution"],
+            cwd=day_dir,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    # Lines look like 'import time:  self [us] | cumulative | imported package',
+    # nested imports are indented and listed before the module importing them
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        entries.append((name.rstrip(), int(self_time), int(cumulative)))
+
+    total = 0
+    modules = []
+    for i, (name, self_time, cumulative) in enumerate(entries):
+        if name.strip() != "solution":
+            continue
+        total = cumulative
+        # walk back over the nested imports until the previous top-level entry
+        for nested_name, nested_self, _ in reversed(entries[:i]):
+            if not nested_name.startswith("  "):
+                break
+            modules.append((nested_name.strip(), nested_self))
+        modules.append(("solution", self_time))
+        break
+
+    return total, sorted(modules, key=lambda module: module[1], reverse=True)
+
+
+def print_startup_report(
+    results: Dict[str, Tuple[int, List[Tuple[str, int]]]], budget_ms: float, top: int
+) -> bool:
+    """
+    Prints the import time of every day against the budget.
+
+    Args:
+    results (Dict[str, Tuple[int, List[Tuple[str, int]]]]): Measurements by day, see measure_import_time.
+    budget_ms (float): The allowed import time in milliseconds.
+    top (int): Number of slowest modules listed per day.
+
+    Returns:
+    bool: True if every day stayed within the budget.
+    """
+    within_budget = True
+
+    helper.print_separator()
+    print(f"{'Day':<12} {'Import (ms)':>12}  Slowest modules (self ms)")
+    helper.print_separator()
+
+    for day, (total, modules) in results.items():
+        total_ms = total / 1000
+        over = total_ms > budget_ms
+        within_budget &= not over
+        total_text = f"{total_ms:>12.1f}"
+        total_text = (
+            helper.red_text(total_text) if over else helper.green_text(total_text)
+        )
+        slowest = ", ".join(f"{name} {us / 1000:.1f}" for name, us in modules[:top])
+        print(f"{day:<12} {total_text}  {slowest}")
+
+    helper.print_separator()
+    if within_budget:
+        print(helper.green_text(f"Every day imports within {budget_ms:.1f} ms."))
+    else:
+        print(helper.red_text(f"Import time exceeds the {budget_ms:.1f} ms budget."))
+    helper.print_separator()
+    return within_budget
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses and returns command line arguments for the startup report.
+
+    Returns:
+    argparse.Namespace: Parsed command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Report how long each day's solution takes to import, harness included."
+    )
+    parser.add_argument("--year", default="2023", help="Year directory to check")
+    parser.add_argument(
+        "--day",
+        type=int,
+        nargs="+",
+        metavar="N",
+        help="Only check the given day numbers",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=50.0,
+        metavar="MS",
+        help="Fail when importing a day's solution takes longer (default: 50)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        metavar="N",
+        help="Number of slowest modules listed per day (default: 5)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_arguments()
+    results = {
+        os.path.basename(day_dir): measure_import_time(day_dir)
+        for day_dir in discover_days(args.year, args.day)
+    }
+    if not print_startup_report(results, args.budget_ms, args.top):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()